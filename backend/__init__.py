@@ -1,29 +1,44 @@
+import logging
+import time
+
 from flask import Flask
 from flask_jwt_extended import JWTManager
 
 from backend.config.config import Config
-from backend.routes.auth_routes import auth_bp
-from backend.routes.item_routes import item_bp
-from backend.routes.claim_routes import claim_bp
-from backend.routes.admin_routes import admin_bp
-from backend.models import init_db
-from backend.helpers.user_helpers import create_default_admin
+from backend.routes import BLUEPRINTS
+from backend.helpers.request_metrics import init_request_metrics
+from backend.services.auth_service import register_token_blocklist
+
+logger = logging.getLogger(__name__)
 
 jwt = JWTManager()
+register_token_blocklist(jwt)
 
-def create_app():
+def create_app(bootstrap: bool = None):
+    """
+    The application factory.
+
+    bootstrap (default Config.BOOTSTRAP_ON_START) runs migrations and the
+    default admin check under a file lock (see backend.bootstrap). The
+    production launcher runs it once before forking workers and turns it off
+    for the app itself.
+    """
+    started = time.perf_counter()
     app = Flask(__name__)
     app.config.from_object(Config)
 
     jwt.init_app(app)
 
-    app.register_blueprint(auth_bp, url_prefix="/api")
-    app.register_blueprint(item_bp, url_prefix="/api")
-    app.register_blueprint(claim_bp, url_prefix="/api")
-    app.register_blueprint(admin_bp, url_prefix="/api")
+    if Config.METRICS_ENABLED:
+        init_request_metrics(app)
+
+    for blueprint, url_prefix in BLUEPRINTS:
+        app.register_blueprint(blueprint, url_prefix=url_prefix)
 
-    with app.app_context():
-        init_db()
-        create_default_admin()
+    if Config.BOOTSTRAP_ON_START if bootstrap is None else bootstrap:
+        from backend.bootstrap import bootstrap as run_bootstrap
+        run_bootstrap()
 
+    app.config["STARTUP_SECONDS"] = time.perf_counter() - started
+    logger.info("App created in %.3fs", app.config["STARTUP_SECONDS"])
     return app
@@ -1,6 +1,9 @@
-from backend.__init__ import create_app
+import os
+from backend import create_app
 
+# WSGI entry point (backend.app:app). For production use `python -m backend.serve`.
 app = create_app()
 
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    # Development server only
+    app.run(debug=os.environ.get("FLASK_DEBUG") == "1", host=os.environ.get("SERVER_HOST", "127.0.0.1"), port=5000)
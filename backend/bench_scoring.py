@@ -0,0 +1,187 @@
+"""
+Claim scoring micro-benchmark.
+
+Compares the compiled scoring plan against the previous per-call
+interpretation of the rules (reproduced below as the baseline) and, when
+numpy is available, batch scoring - all on one fixed, seeded dataset.
+
+The baseline only knew "exact" and "contains", so the comparison runs on
+BASELINE_RULES (SCORING_RULES with every other tolerance as "contains",
+i.e. the rules it shipped with). The current SCORING_RULES are timed
+separately and have no baseline.
+
+Usage:
+    python -m backend.bench_scoring [--claims 500] [--items 200] [--repeat 3]
+"""
+import argparse
+import random
+import time
+
+from backend.config.claim_scoring import SCORING_RULES
+from backend.services.claim_scoring import compute_claim_score, compile_scoring_plan, get_scoring_plan, normalize
+
+
+# ==================================================
+# BASELINE: rules interpreted on every call
+# ==================================================
+
+BASELINE_RULES = {
+    field: {
+        "weight": rule["weight"],
+        "tolerance": "exact" if rule["tolerance"] == "exact" else "contains"
+    }
+    for field, rule in SCORING_RULES.items()
+}
+
+
+def legacy_match_with_tolerance(claim_value, found_value, tolerance):
+    a = normalize(claim_value)
+    b = normalize(found_value)
+
+    if not a or not b:
+        return False
+
+    matchers = {
+        "exact": lambda x, y: x == y,
+        "contains": lambda x, y: x in y or y in x
+    }
+
+    return matchers[tolerance](a, b)
+
+
+def legacy_compute_claim_score(claim_data, found_item):
+    total_score = 0
+    matched_fields = []
+    breakdown = []
+
+    field_map = {
+        "category": ("claimed_category", "category"),
+        "item_type": ("claimed_item_type", "item_type"),
+        "brand": ("claimed_brand", "brand"),
+        "color": ("claimed_color", "color"),
+        "location": ("claimed_location", "found_location"),
+        "private_details": ("claimed_private_details", "public_description"),
+    }
+
+    for field, (claim_key, found_key) in field_map.items():
+        rule = BASELINE_RULES[field]
+        matched = legacy_match_with_tolerance(
+            claim_data.get(claim_key), found_item.get(found_key), rule["tolerance"]
+        )
+        earned = rule["weight"] if matched else 0
+        total_score += earned
+        if matched:
+            matched_fields.append(field)
+        breakdown.append({
+            "field": field,
+            "matched": matched,
+            "score": earned,
+            "max_score": rule["weight"]
+        })
+
+    return {"total": total_score, "matched": matched_fields, "breakdown": breakdown}
+
+
+# ==================================================
+# FIXED DATASET
+# ==================================================
+
+CATEGORIES = ["Electronics", "Bags", "Keys", "Clothing", "Documents", "Jewelry"]
+ITEM_TYPES = ["Phone", "Smartphone", "Laptop", "Backpack", "Wallet", "Key ring", "Jacket", "Passport"]
+BRANDS = ["Samsung", "Apple", "Nike", "Adidas", "Lenovo", "Samsung Galaxy", "", None]
+COLORS = ["Black", "Dark blue", "Blue", "Red", "Silver", "White", None]
+LOCATIONS = ["Library", "Main Library", "Gym", "Cafeteria", "Parking Lot B", "Lecture Hall 3"]
+DETAILS = ["cracked screen", "sticker on back", "blue case", "initials engraved", "torn strap", None]
+
+
+def build_dataset(n_claims: int, n_items: int, seed: int = 42):
+    rng = random.Random(seed)
+    found_items = [
+        {
+            "id": i + 1,
+            "category": rng.choice(CATEGORIES),
+            "item_type": rng.choice(ITEM_TYPES),
+            "brand": rng.choice(BRANDS),
+            "color": rng.choice(COLORS),
+            "found_location": rng.choice(LOCATIONS),
+            "public_description": rng.choice(DETAILS),
+        }
+        for i in range(n_items)
+    ]
+    claims = [
+        {
+            "claimed_category": rng.choice(CATEGORIES),
+            "claimed_item_type": rng.choice(ITEM_TYPES),
+            "claimed_brand": rng.choice(BRANDS),
+            "claimed_color": rng.choice(COLORS),
+            "claimed_location": rng.choice(LOCATIONS),
+            "claimed_private_details": rng.choice(DETAILS),
+        }
+        for _ in range(n_claims)
+    ]
+    return claims, found_items
+
+
+# ==================================================
+# RUNNER
+# ==================================================
+
+def best_of(repeat: int, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Claim scoring micro-benchmark")
+    parser.add_argument("--claims", type=int, default=500)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    claims, found_items = build_dataset(args.claims, args.items)
+    pairs = len(claims) * len(found_items)
+
+    def run(score):
+        return [[score(c, f)["total"] for f in found_items] for c in claims]
+
+    try:
+        from backend.services.batch_scoring import score_claims_batch
+        score_claims_batch([], [])
+    except RuntimeError:
+        score_claims_batch = None
+
+    def measure(plan, reference, results):
+        compiled = lambda c, f: compute_claim_score(c, f, plan)
+        if run(compiled) != reference:
+            raise SystemExit("[FAIL] Compiled plan disagrees with reference scores")
+        results["compiled plan"] = best_of(args.repeat, lambda: run(compiled))
+        if score_claims_batch is not None:
+            if score_claims_batch(claims, found_items, plan)["totals"].tolist() != reference:
+                raise SystemExit("[FAIL] Batch scores disagree with reference scores")
+            results["batch (numpy)"] = best_of(args.repeat, lambda: score_claims_batch(claims, found_items, plan))
+        return results
+
+    baseline_results = measure(
+        compile_scoring_plan(BASELINE_RULES),
+        run(legacy_compute_claim_score),
+        {"baseline (interpreted)": best_of(args.repeat, lambda: run(legacy_compute_claim_score))}
+    )
+    plan = get_scoring_plan()
+    current_results = measure(plan, run(lambda c, f: compute_claim_score(c, f, plan)), {})
+
+    print(f"{len(claims)} claims x {len(found_items)} items = {pairs} pairs, best of {args.repeat}")
+    print("BASELINE_RULES (exact / contains):")
+    baseline = baseline_results["baseline (interpreted)"]
+    for name, seconds in baseline_results.items():
+        print(f"  {name:<24} {seconds * 1000:9.1f} ms  {pairs / seconds:12,.0f} pairs/s  x{baseline / seconds:5.1f}")
+    print("SCORING_RULES (current):")
+    for name, seconds in current_results.items():
+        print(f"  {name:<24} {seconds * 1000:9.1f} ms  {pairs / seconds:12,.0f} pairs/s")
+
+
+if __name__ == "__main__":
+    main()
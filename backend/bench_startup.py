@@ -0,0 +1,63 @@
+"""
+Startup-time measurement.
+
+Times, each in a fresh interpreter:
+  - cold bootstrap: first start against an empty database (migrations + admin hash)
+  - warm start: importing the app and create_app() against a current database,
+    i.e. what every worker restart pays when the app is not preloaded
+
+Exits non-zero when the median warm start exceeds STARTUP_TARGET_MS.
+
+Usage:
+    python -m backend.bench_startup [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from backend.config.config import Config
+
+PROBE = """
+import time
+started = time.perf_counter()
+from backend import create_app
+create_app()
+print((time.perf_counter() - started) * 1000)
+"""
+
+
+def time_start(database: str) -> float:
+    env = dict(os.environ, DATABASE_PATH=database)
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE], env=env, check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup-time measurement")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = os.path.join(tmp, "startup.db")
+        cold = time_start(database)
+        warm = [time_start(database) for _ in range(args.runs)]
+
+    median = statistics.median(warm)
+    print(f"cold bootstrap   {cold:8.1f} ms")
+    print(f"warm start       {median:8.1f} ms median of {args.runs} (min {min(warm):.1f}, max {max(warm):.1f})")
+    print(f"target           {Config.STARTUP_TARGET_MS:8.1f} ms")
+    if median > Config.STARTUP_TARGET_MS:
+        print("[FAIL] Warm start exceeds STARTUP_TARGET_MS")
+        return 1
+    print("[PASS] Warm start within target")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
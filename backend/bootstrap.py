@@ -0,0 +1,54 @@
+"""
+One-time startup work: schema migrations and the default admin account.
+
+Runs under an exclusive file lock next to the database, so when several
+processes start at once (gunicorn without preload, a second instance during
+a deploy) exactly one does the work and the rest find it done - both steps
+are a single cheap query once the database is current.
+
+Usage:
+    python -m backend.bootstrap
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from backend.models import init_db, close_db_connections
+from backend.models.base import DataBase
+from backend.helpers.user_helpers import create_default_admin
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def bootstrap_lock():
+    with open(f"{os.path.abspath(DataBase)}.bootstrap.lock", "a") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def bootstrap() -> dict:
+    """Apply pending migrations and ensure the default admin exists. Returns timings."""
+    started = time.perf_counter()
+    with bootstrap_lock():
+        waited = time.perf_counter() - started
+        applied = init_db()
+        create_default_admin()
+    # Do not hand connections opened here to forked workers
+    close_db_connections()
+
+    seconds = time.perf_counter() - started
+    logger.info("Bootstrap done in %.3fs (waited %.3fs for lock, migrations applied: %s)", seconds, waited, applied or "none")
+    return {"seconds": seconds, "lock_wait_seconds": waited, "migrations_applied": applied}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(bootstrap())
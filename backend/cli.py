@@ -0,0 +1,104 @@
+"""
+Maintenance commands.
+
+Usage:
+    python -m backend.cli import-found items.csv [--format csv|ndjson] [--reported-by NAME]
+    python -m backend.cli rescore [--workers N] [--chunk-size N] [--restart]
+    python -m backend.cli archive-audit [--older-than-days N] [--chunk-size N]
+    python -m backend.cli purge-revocations
+"""
+import argparse
+import json
+import sys
+
+from backend.models import init_db, flush_audit_log
+
+
+def import_found(args):
+    from backend.services.import_service import import_found_items
+
+    fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    with open(args.path, encoding="utf-8-sig", newline="") as stream:
+        result, status = import_found_items(stream, fmt, args.reported_by, args.chunk_size)
+
+    flush_audit_log()
+    print(json.dumps({k: v for k, v in result.items() if k != "item_ids"}, indent=2))
+    return 0 if status == 201 else 1
+
+
+def rescore(args):
+    from backend.services.rescoring_service import rescore_pending_claims
+
+    def report(stats):
+        total = stats["total"] or 1
+        print(
+            f"\r{stats['processed']}/{stats['total']} claims "
+            f"({100 * stats['processed'] / total:.1f}%), {stats['updated']} updated, "
+            f"last id {stats['last_claim_id']}, {stats['seconds']:.1f}s",
+            end="", file=sys.stderr, flush=True
+        )
+
+    result = rescore_pending_claims(
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        resume=not args.restart,
+        progress=report
+    )
+    print(file=sys.stderr)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+def archive_audit(args):
+    from backend.models import archive_audit_logs
+
+    # Rows still queued in the audit sink belong in the database first
+    flush_audit_log()
+    result = archive_audit_logs(older_than_days=args.older_than_days, chunk_size=args.chunk_size)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+def purge_revocations(args):
+    from backend.services.revocation_service import revocation_store
+
+    print(json.dumps({"purged": revocation_store.purge()}, indent=2))
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="backend.cli", description="Lost & Found maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import-found", help="Bulk import found items from CSV or NDJSON")
+    importer.add_argument("path")
+    importer.add_argument("--format", choices=["csv", "ndjson"])
+    importer.add_argument("--reported-by", default="cli")
+    importer.add_argument("--chunk-size", type=int, default=None)
+    importer.set_defaults(handler=import_found)
+
+    rescorer = commands.add_parser("rescore", help="Recompute scores of pending claims with current SCORING_RULES")
+    rescorer.add_argument("--workers", type=int, default=None)
+    rescorer.add_argument("--chunk-size", type=int, default=None)
+    rescorer.add_argument("--restart", action="store_true", help="Ignore any saved checkpoint")
+    rescorer.set_defaults(handler=rescore)
+
+    archiver = commands.add_parser("archive-audit", help="Move old audit rows into compressed archive segments")
+    archiver.add_argument("--older-than-days", type=int, default=None)
+    archiver.add_argument("--chunk-size", type=int, default=None)
+    archiver.set_defaults(handler=archive_audit)
+
+    purger = commands.add_parser("purge-revocations", help="Delete revoked tokens that have expired")
+    purger.set_defaults(handler=purge_revocations)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    init_db()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
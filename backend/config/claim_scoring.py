@@ -9,18 +9,43 @@ SCORING_RULES = {
     },
     "brand": {
         "weight": 20,
-        "tolerance": "contains"
+        "tolerance": "fuzzy",
+        "threshold": 0.4
     },
     "color": {
         "weight": 15,
-        "tolerance": "contains"
+        "tolerance": "fuzzy",
+        "threshold": 0.4,
+        "synonyms": "color"
     },
     "location": {
         "weight": 10,
-        "tolerance": "contains"
+        "tolerance": "fuzzy",
+        "threshold": 0.4
     },
     "private_details": {
         "weight": 40,
         "tolerance": "contains"
     }
-}
\ No newline at end of file
+}
+
+# Canonical value -> equivalent spellings, used by the "fuzzy" tolerance
+COLOR_SYNONYMS = {
+    "dark blue": ["navy", "navy blue", "midnight blue", "dark navy"],
+    "light blue": ["sky blue", "baby blue", "pale blue"],
+    "grey": ["gray", "charcoal", "ash"],
+    "dark grey": ["dark gray", "charcoal grey", "charcoal gray", "gunmetal"],
+    "silver": ["metallic", "chrome"],
+    "gold": ["golden"],
+    "red": ["maroon", "burgundy", "crimson", "scarlet"],
+    "purple": ["violet", "lilac", "lavender"],
+    "pink": ["rose", "magenta"],
+    "brown": ["tan", "beige", "khaki", "camel"],
+    "white": ["ivory", "cream", "off white"],
+    "green": ["olive", "khaki green", "lime"],
+    "black": ["jet black", "matte black"],
+}
+
+SYNONYM_TABLES = {
+    "color": COLOR_SYNONYMS
+}
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from datetime import timedelta
 
 
@@ -24,4 +25,75 @@ class Config:
     # Safer defaults
     JWT_TOKEN_LOCATION = ["headers"]
     JWT_HEADER_NAME = "Authorization"
-    JWT_HEADER_TYPE = "Bearer"
\ No newline at end of file
+    JWT_HEADER_TYPE = "Bearer"
+
+    # Startup and production server (python -m backend.serve)
+    BOOTSTRAP_ON_START = os.environ.get("BOOTSTRAP_ON_START", "1") == "1"
+    SERVER_HOST = os.environ.get("SERVER_HOST", "0.0.0.0")
+    SERVER_PORT = int(os.environ.get("SERVER_PORT", 5000))
+    SERVER_WORKERS = int(os.environ.get("SERVER_WORKERS", 2 * (os.cpu_count() or 1) + 1))
+    SERVER_THREADS = int(os.environ.get("SERVER_THREADS", 4))
+    SERVER_TIMEOUT = int(os.environ.get("SERVER_TIMEOUT", 30))
+    STARTUP_TARGET_MS = float(os.environ.get("STARTUP_TARGET_MS", 500))
+
+    # SQLite connection pool
+    DB_BUSY_TIMEOUT_MS = int(os.environ.get("DB_BUSY_TIMEOUT_MS", 5000))
+    DB_CACHED_STATEMENTS = int(os.environ.get("DB_CACHED_STATEMENTS", 256))
+    DB_JOURNAL_MODE = os.environ.get("DB_JOURNAL_MODE", "WAL")
+    DB_SYNCHRONOUS = os.environ.get("DB_SYNCHRONOUS", "NORMAL")
+
+    # Write serialization: "direct" (each thread writes on its own connection)
+    # or "queue" (one writer thread per process, group-committed batches;
+    # readers use mode=ro connections)
+    DB_WRITE_MODE = os.environ.get("DB_WRITE_MODE", "direct")
+    DB_WRITE_BATCH_SIZE = int(os.environ.get("DB_WRITE_BATCH_SIZE", 64))
+    DB_WRITE_QUEUE_SIZE = int(os.environ.get("DB_WRITE_QUEUE_SIZE", 1000))
+    DB_WRITE_TIMEOUT = float(os.environ.get("DB_WRITE_TIMEOUT", 30))
+
+    # Audit log writer
+    AUDIT_ASYNC = os.environ.get("AUDIT_ASYNC", "1") == "1"
+    AUDIT_BATCH_SIZE = int(os.environ.get("AUDIT_BATCH_SIZE", 200))
+    AUDIT_FLUSH_INTERVAL = float(os.environ.get("AUDIT_FLUSH_INTERVAL", 0.5))
+    AUDIT_QUEUE_SIZE = int(os.environ.get("AUDIT_QUEUE_SIZE", 10000))
+
+    # Audit retention (archive dir defaults to audit_archive/ next to the database)
+    AUDIT_RETENTION_DAYS = int(os.environ.get("AUDIT_RETENTION_DAYS", 90))
+    AUDIT_ARCHIVE_CHUNK_SIZE = int(os.environ.get("AUDIT_ARCHIVE_CHUNK_SIZE", 5000))
+    AUDIT_ARCHIVE_DIR = os.environ.get("AUDIT_ARCHIVE_DIR")
+
+    # Bulk import
+    IMPORT_CHUNK_SIZE = int(os.environ.get("IMPORT_CHUNK_SIZE", 500))
+
+    # Lost -> found matching
+    MATCH_TOP_K = int(os.environ.get("MATCH_TOP_K", 10))
+    MATCH_CANDIDATE_LIMIT = int(os.environ.get("MATCH_CANDIDATE_LIMIT", 200))
+
+    # Rescoring job
+    RESCORE_CHUNK_SIZE = int(os.environ.get("RESCORE_CHUNK_SIZE", 1000))
+    RESCORE_WORKERS = int(os.environ.get("RESCORE_WORKERS", os.cpu_count() or 1))
+
+    # Password hashing pool (workers=0 hashes on the request thread)
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_QUEUE_LIMIT = int(os.environ.get("PASSWORD_HASH_QUEUE_LIMIT", 8))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get("PASSWORD_HASH_TIMEOUT", 5))
+    PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+
+    # User record cache (per process)
+    USER_CACHE_TTL = float(os.environ.get("USER_CACHE_TTL", 60))
+    USER_CACHE_MAX_ENTRIES = int(os.environ.get("USER_CACHE_MAX_ENTRIES", 1024))
+
+    # Token revocation store
+    REVOCATION_SYNC_INTERVAL = float(os.environ.get("REVOCATION_SYNC_INTERVAL", 1.0))
+    REVOCATION_PURGE_INTERVAL = float(os.environ.get("REVOCATION_PURGE_INTERVAL", 600))
+    REVOCATION_BLOOM_CAPACITY = int(os.environ.get("REVOCATION_BLOOM_CAPACITY", 100000))
+    REVOCATION_BLOOM_ERROR_RATE = float(os.environ.get("REVOCATION_BLOOM_ERROR_RATE", 0.001))
+
+    # Read-through cache ("memory", "file" or "none")
+    CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+    CACHE_TTL = float(os.environ.get("CACHE_TTL", 30))
+    CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", 2048))
+    CACHE_DIR = os.environ.get("CACHE_DIR", os.path.join(tempfile.gettempdir(), "lostnfound-cache"))
+    CACHE_SWEEP_INTERVAL = float(os.environ.get("CACHE_SWEEP_INTERVAL", 60))
+
+    # Request and SQL metrics (per process, served at /api/admin/metrics)
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") == "1"
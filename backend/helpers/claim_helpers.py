@@ -1,18 +1,11 @@
-from backend.models.base import get_db_connection
+from backend.models.base import get_read_connection
 
 def get_claim_by_id(claim_id: int):
     """Fetch a claim by ID. Returns dict or None if not found."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT * FROM claims WHERE id=?", (claim_id,))
-    row = cursor.fetchone()
+    with get_read_connection() as conn:
+        row = conn.execute("SELECT * FROM claims WHERE id=?", (claim_id,)).fetchone()
 
     if not row:
-        conn.close()
         return None
 
-    keys = [column[0] for column in cursor.description]
-    claim = dict(zip(keys, row))
-    conn.close()
-    return claim
\ No newline at end of file
+    return dict(row)
\ No newline at end of file
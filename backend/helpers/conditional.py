@@ -0,0 +1,45 @@
+import hashlib
+from functools import wraps
+from flask import request, make_response
+from backend.models import get_table_versions
+from backend.helpers.streaming import wants_stream
+
+
+def list_etag(tables) -> str:
+    """
+    Strong ETag for a list response built from `tables`: their change
+    counters plus everything in the request that shapes the payload.
+    """
+    versions = get_table_versions(*tables)
+    parts = [f"{table}={version}" for table, version in versions.items()]
+    parts += [request.full_path, "ndjson" if wants_stream(request) else "json"]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def conditional_get(*tables):
+    """
+    Answer GET requests with 304 Not Modified when If-None-Match carries the
+    current ETag, before the view runs - no list query, no serialization.
+    Successful responses get the ETag attached for the next poll.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if request.method != "GET":
+                return fn(*args, **kwargs)
+
+            # Read before the view queries: a concurrent write can only make
+            # this tag stale (forcing a refetch), never mask a change.
+            etag = list_etag(tables)
+            if request.if_none_match.contains(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response
+        return wrapper
+    return decorator
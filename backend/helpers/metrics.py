@@ -0,0 +1,104 @@
+import bisect
+import threading
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Every Histogram and Counter created in this process, in creation order
+REGISTRY = []
+
+
+class Histogram:
+    """Thread-safe, in-process latency histogram with cumulative buckets (seconds)."""
+
+    def __init__(self, name: str, description: str = "", buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}
+        REGISTRY.append(self)
+
+    def observe(self, seconds: float, **labels):
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            series["counts"][index] += 1
+            series["sum"] += seconds
+            series["count"] += 1
+
+    def snapshot(self) -> list:
+        """Return [{labels, buckets: [(le, cumulative count)], sum, count}, ...]."""
+        with self._lock:
+            result = []
+            for key, series in self._series.items():
+                cumulative, running = [], 0
+                for le, count in zip(self.buckets + (float("inf"),), series["counts"]):
+                    running += count
+                    cumulative.append((le, running))
+                result.append({
+                    "labels": dict(key),
+                    "buckets": cumulative,
+                    "sum": series["sum"],
+                    "count": series["count"],
+                })
+            return result
+
+
+class Counter:
+    """Thread-safe, in-process monotonically increasing counter."""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._lock = threading.Lock()
+        self._values = {}
+        REGISTRY.append(self)
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [{"labels": dict(key), "value": value} for key, value in self._values.items()]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(metrics=None) -> str:
+    """Render metrics (default: REGISTRY) in the Prometheus text exposition format."""
+    lines = []
+    for metric in REGISTRY if metrics is None else metrics:
+        lines.append(f"# HELP {metric.name} {_escape(metric.description)}")
+        if isinstance(metric, Histogram):
+            lines.append(f"# TYPE {metric.name} histogram")
+            for series in metric.snapshot():
+                for le, count in series["buckets"]:
+                    labels = _format_labels({**series["labels"], "le": _format_value(le)})
+                    lines.append(f"{metric.name}_bucket{labels} {count}")
+                labels = _format_labels(series["labels"])
+                lines.append(f"{metric.name}_sum{labels} {_format_value(series['sum'])}")
+                lines.append(f"{metric.name}_count{labels} {series['count']}")
+        else:
+            lines.append(f"# TYPE {metric.name} counter")
+            for series in metric.snapshot():
+                lines.append(f"{metric.name}{_format_labels(series['labels'])} {_format_value(series['value'])}")
+    return "\n".join(lines) + "\n"
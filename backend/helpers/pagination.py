@@ -0,0 +1,52 @@
+import base64
+import json
+from backend.models import ValidationError, validate_int
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def parse_limit(value, default: int = DEFAULT_PAGE_SIZE, maximum: int = MAX_PAGE_SIZE) -> int:
+    """Parse a page size from query args, clamped to [1, maximum]."""
+    if value in (None, ""):
+        return default
+    limit = validate_int(value, "limit")
+    if limit < 1:
+        raise ValidationError("limit must be a positive integer", 400)
+    return min(limit, maximum)
+
+
+def encode_cursor(values) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor."""
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int):
+    """Decode a cursor produced by encode_cursor. Raises ValidationError if malformed."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor", 400)
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError("Invalid cursor", 400)
+    # Values become SQL bind parameters; nested JSON would make sqlite3 fail
+    if not all(value is None or isinstance(value, (str, int, float)) for value in values):
+        raise ValidationError("Invalid cursor", 400)
+    return tuple(values)
+
+
+def build_page(rows: list, limit: int, key) -> dict:
+    """
+    Trim a result fetched with limit + 1 rows into a page.
+
+    `key` maps a row to its sort key; the key of the last returned row
+    becomes `next_cursor` when more rows exist.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(key(rows[-1])) if has_more and rows else None
+    return {"items": rows, "next_cursor": next_cursor}
@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from werkzeug.security import generate_password_hash, check_password_hash
+from backend.config.config import Config
+from backend.helpers.metrics import Histogram, Counter
+
+HASH_LATENCY = Histogram(
+    "password_hash_seconds",
+    "Time from submitting a password hash/verify to its result, including queueing",
+)
+HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Hash/verify requests refused because the hashing pool was saturated",
+)
+
+
+class HashingBusyError(Exception):
+    """The hashing pool is saturated; the caller should answer 429."""
+
+    def __init__(self, message: str = "Too many concurrent login attempts, retry shortly", retry_after: int = 1):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+
+def _hashing_context():
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Hashers only need werkzeug; by default the server would import __main__
+    context.set_forkserver_preload(["werkzeug.security"])
+    return context
+
+
+class PasswordHasher:
+    """
+    Runs werkzeug hashing in a small process pool so CPU-bound hashing cannot
+    pin the request threads.
+
+    At most workers + queue_limit operations are in flight per process; beyond
+    that (or when a result takes longer than timeout seconds) HashingBusyError
+    is raised immediately instead of queueing. workers=0 hashes inline.
+    """
+
+    def __init__(self, workers: int, queue_limit: int, timeout: float, method: str):
+        self.workers = workers
+        self.timeout = timeout
+        self.method = method
+        self._slots = threading.BoundedSemaphore(max(workers, 1) + queue_limit)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+
+    def _get_pool(self):
+        if self._pool is not None and self._pid == os.getpid():
+            return self._pool
+        with self._lock:
+            # Pools do not survive fork; each worker process starts its own.
+            # Hashers are started from a clean forkserver instead of forking a
+            # worker that holds threads, locks and open SQLite connections.
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=_hashing_context()
+                )
+                self._pid = os.getpid()
+            return self._pool
+
+    def _run(self, op: str, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            HASH_REJECTED.inc(op=op)
+            raise HashingBusyError()
+
+        start = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                try:
+                    return fn(*args)
+                finally:
+                    self._slots.release()
+
+            try:
+                future = self._get_pool().submit(fn, *args)
+            except Exception:
+                self._slots.release()
+                raise
+            # The slot stays taken until the work really finishes, even if we stop waiting
+            future.add_done_callback(lambda _: self._slots.release())
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeout:
+                future.cancel()
+                HASH_REJECTED.inc(op=op)
+                raise HashingBusyError()
+        finally:
+            HASH_LATENCY.observe(time.perf_counter() - start, op=op)
+
+    def hash(self, password: str) -> str:
+        return self._run("hash", generate_password_hash, password, self.method)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        return self._run("verify", check_password_hash, password_hash, password)
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+password_hasher = PasswordHasher(
+    workers=Config.PASSWORD_HASH_WORKERS,
+    queue_limit=Config.PASSWORD_HASH_QUEUE_LIMIT,
+    timeout=Config.PASSWORD_HASH_TIMEOUT,
+    method=Config.PASSWORD_HASH_METHOD,
+)
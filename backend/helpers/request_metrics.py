@@ -0,0 +1,43 @@
+import time
+from flask import g, request
+from backend.helpers.metrics import Histogram, Counter
+from backend.models.base import query_stats
+
+SQL_QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "Request latency by endpoint, method and status")
+SQL_QUERIES = Counter("sql_queries_total", "SQL statements executed on request threads, by endpoint")
+SQL_ROWS = Counter("sql_rows_total", "Rows fetched or changed by request-thread SQL, by endpoint")
+SQL_SECONDS = Counter("sql_duration_seconds_total", "Time spent in SQL on request threads, by endpoint")
+SQL_PER_REQUEST = Histogram("sql_queries_per_request", "SQL statements per request, by endpoint", SQL_QUERY_BUCKETS)
+
+
+def _start():
+    g.metrics_started = time.perf_counter()
+    query_stats.reset()
+
+
+def _record(response):
+    started = g.pop("metrics_started", None)
+    if started is None:
+        return response
+    # Time until the response is handed to the server; streamed bodies are
+    # produced after this point
+    elapsed = time.perf_counter() - started
+    endpoint = request.endpoint or "unmatched"
+    REQUEST_LATENCY.observe(elapsed, endpoint=endpoint, method=request.method, status=str(response.status_code))
+    SQL_QUERIES.inc(query_stats.queries, endpoint=endpoint)
+    SQL_ROWS.inc(query_stats.rows, endpoint=endpoint)
+    SQL_SECONDS.inc(query_stats.seconds, endpoint=endpoint)
+    SQL_PER_REQUEST.observe(query_stats.queries, endpoint=endpoint)
+    return response
+
+
+def init_request_metrics(app):
+    """
+    Time every request of `app` and attribute the SQL its thread ran to
+    the endpoint (blueprint.view). SQL run by the writer thread in
+    DB_WRITE_MODE=queue is not attributed.
+    """
+    app.before_request(_start)
+    app.after_request(_record)
@@ -0,0 +1,32 @@
+import json
+from flask import Response, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 500
+
+
+def wants_stream(request) -> bool:
+    """True when the client opted into NDJSON via ?stream=1 or the Accept header."""
+    if request.args.get("stream") in ("1", "true"):
+        return True
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+def ndjson_response(rows, batch_size: int = STREAM_BATCH_SIZE) -> Response:
+    """
+    Stream an iterable of dicts as newline-delimited JSON.
+
+    Rows are serialized and flushed batch_size at a time, so memory stays
+    constant no matter how many rows the iterable produces.
+    """
+    def generate():
+        chunk = []
+        for row in rows:
+            chunk.append(json.dumps(row, default=str))
+            if len(chunk) >= batch_size:
+                yield "\n".join(chunk) + "\n"
+                chunk = []
+        if chunk:
+            yield "\n".join(chunk) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
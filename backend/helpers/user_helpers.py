@@ -1,40 +1,28 @@
 import sqlite3
-from datetime import datetime, timezone
-from werkzeug.security import generate_password_hash, check_password_hash
-from backend.models.base import get_db_connection
-
-DB_PATH = "database.db" 
+from werkzeug.security import generate_password_hash
+from backend.config.config import Config
+from backend.models import get_user_by_username, insert_user
+from backend.helpers.password_hashing import password_hasher
 
 # User Helper Functions
 def hash_password(password: str) -> str:
-    """Hash a password using werkzeug."""
-    return generate_password_hash(password)
+    """Hash a password in the hashing pool. Raises HashingBusyError when saturated."""
+    return password_hasher.hash(password)
 
 def verify_password(password: str, password_hash: str) -> bool:
-    """Check a password against its hash."""
-    return check_password_hash(password_hash, password)
+    """Check a password against its hash in the hashing pool. Raises HashingBusyError when saturated."""
+    return password_hasher.verify(password, password_hash)
 
 
 def create_user(username: str, password: str, role: str = "user"):
     """Add a user to the users table safely and handle duplicates."""
+    hashed_password = hash_password(password)
     try:
-        hashed_password = hash_password(password)
-        with sqlite3.connect(DB_PATH, timeout=10) as conn:
-            c = conn.cursor()
-            try:
-                c.execute(
-                    """
-                    INSERT INTO users (username, password_hash, role, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (username, hashed_password, role, datetime.now(timezone.utc).isoformat())
-                )
-                conn.commit()
-                user_id = c.lastrowid
-                return {"user_id": user_id, "message": "User created successfully"}
+        user_id = insert_user(username, hashed_password, role)
+        return {"user_id": user_id, "message": "User created successfully"}
 
-            except sqlite3.IntegrityError:
-                return {"error": "Username already exists"}
+    except sqlite3.IntegrityError:
+        return {"error": "Username already exists"}
 
     except sqlite3.OperationalError as e:
         return {"error": f"Database error: {str(e)}"}
@@ -44,30 +32,13 @@ def create_user(username: str, password: str, role: str = "user"):
     
 def get_user(username: str):
     """Fetch a user by username. Returns dict or None."""
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("SELECT id, username, password_hash, role, created_at FROM users WHERE username = ?", (username,))
-        row = c.fetchone()
-        if row:
-            return {
-                "id": row[0],
-                "username": row[1],
-                "password_hash": row[2],
-                "role": row[3],
-                "created_at": row[4]
-            }
-        return None
+    return get_user_by_username(username)
 
 def create_default_admin():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT * FROM users WHERE username = 'admin'")
-    if cursor.fetchone() is None:
-        password_hash = hash_password("adminpassword")
-        cursor.execute(
-            "INSERT INTO users (username, password_hash, role, created_at) VALUES (?, ?, ?, ?)",
-            ("admin", password_hash, "admin", datetime.now(timezone.utc).isoformat())
-        )
-        conn.commit()
-    conn.close()
+    if get_user_by_username("admin") is None:
+        # One-off at bootstrap: hash inline rather than spinning up the pool
+        password_hash = generate_password_hash("adminpassword", Config.PASSWORD_HASH_METHOD)
+        try:
+            insert_user("admin", password_hash, "admin")
+        except sqlite3.IntegrityError:
+            pass  # another worker created it first
@@ -1,25 +1,59 @@
 # Base
-from .base import get_db_connection, init_db
+from .base import get_db_connection, get_read_connection, close_db_connections, init_db, transaction
+from .writer import serialized_write
+from .migrations import LATEST_VERSION, get_schema_version
 
 # Items
 from .items import (
     create_lost_item,
     create_found_item,
     get_published_found_items,
-    get_found_item_by_id
+    iter_published_found_items,
+    get_found_item_by_id,
+    update_found_item_status,
+    invalidate_found_item,
+    bulk_create_found_items,
+    search_found_items,
+    get_lost_item_by_id,
+    find_found_item_candidates,
+    find_similar_found_items
 )
 
 # Claims
 from .claims import (
     create_claim,
     get_pending_claims,
+    iter_pending_claims,
+    get_claim_review_queue,
+    get_pending_claims_for_scoring,
+    count_pending_claims,
+    update_claim_scores,
     update_claim,
     update_claim_status,
-    verify_claim
+    verify_claim,
+    verify_claims
 )
 
+# Users
+from .users import get_user_by_username, get_user_by_id, insert_user, invalidate_user
+
+# Table change counters
+from .versions import get_table_versions
+
+# Token revocations
+from .revocations import (
+    revoke_token,
+    is_token_revoked_in_db,
+    get_revocations_since,
+    purge_expired_revocations
+)
+
+# Job checkpoints
+from .checkpoints import get_checkpoint, save_checkpoint, clear_checkpoint
+
 # Audit
-from .audit import log_action
+from .audit import log_action, log_actions, flush_audit_log, get_audit_logs
+from .audit_archive import archive_audit_logs, iter_archived_audit_logs
 
 # Validators
 from .validators import (
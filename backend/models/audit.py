@@ -1,11 +1,170 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
 from datetime import datetime, timezone
-from .base import get_db_connection
+from typing import Optional, Dict, Any
+from backend.config.config import Config
+from .base import get_read_connection, transaction
+from .writer import serialized_write
 from .validators import ValidationError, require_fields, validate_int
 
+logger = logging.getLogger(__name__)
+
+INSERT_AUDIT_LOG = """
+    INSERT INTO audit_logs (action, entity_type, entity_id, performed_by, timestamp, notes)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+@serialized_write
+def write_audit_entries(entries: list[tuple]):
+    """Insert audit rows with a single executemany in one transaction."""
+    if not entries:
+        return
+    with transaction() as conn:
+        conn.executemany(INSERT_AUDIT_LOG, entries)
+
+
+class AuditSink:
+    """
+    In-process queue that writes audit rows off the request path.
+
+    A daemon thread drains the queue and flushes a batch whenever it reaches
+    batch_size entries or flush_interval seconds pass. When the queue is full
+    (or async mode is disabled) entries are written synchronously instead.
+    Pending entries are flushed at interpreter shutdown.
+    """
+
+    _STOP = object()
+
+    def __init__(self, batch_size: int, flush_interval: float, max_queue: int, enabled: bool = True):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._atexit_registered = False
+
+    def _ensure_started(self):
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            # Threads do not survive fork; a worker starts its own writer.
+            self._queue = queue.Queue(maxsize=self.max_queue)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+
+    def submit(self, entry: tuple):
+        """Queue one audit row, falling back to a synchronous write."""
+        self.submit_many([entry])
+
+    def submit_many(self, entries: list[tuple]):
+        """Queue audit rows; whatever does not fit is written synchronously in one batch."""
+        if not self.enabled:
+            write_audit_entries(entries)
+            return
+        self._ensure_started()
+        overflow = []
+        for entry in entries:
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                overflow.append(entry)
+        write_audit_entries(overflow)
+
+    def _run(self):
+        q = self._queue
+        while True:
+            item = q.get()
+            if item is self._STOP:
+                q.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                write_audit_entries(batch)
+            except Exception:
+                logger.exception("Failed to write %d audit entries", len(batch))
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    q.task_done()
+
+            if stop:
+                return
+
+    def flush(self):
+        """Block until every queued entry has been written."""
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            self._queue.join()
+
+    def shutdown(self):
+        """Stop the writer thread after writing everything still queued."""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                leftovers.append(item)
+        write_audit_entries(leftovers)
+        self._thread = None
+
+
+audit_sink = AuditSink(
+    batch_size=Config.AUDIT_BATCH_SIZE,
+    flush_interval=Config.AUDIT_FLUSH_INTERVAL,
+    max_queue=Config.AUDIT_QUEUE_SIZE,
+    enabled=Config.AUDIT_ASYNC
+)
+
+
+def flush_audit_log():
+    """Wait for queued audit entries to reach the database."""
+    audit_sink.flush()
+
+
 def log_action(action: str, entity_type: str, entity_id: int, performed_by: str, notes: str = None):
     """
     Logs an action in the audit_logs table.
 
+    The entry is validated immediately and handed to the audit sink. Inside a
+    transaction it is only queued once the transaction commits, so rolled back
+    work leaves no audit trail.
+
     Parameters:
         action (str): The action performed (e.g., "create", "update", "approve").
         entity_type (str): The type of entity affected (e.g., "claim", "found_item").
@@ -30,18 +189,15 @@ def log_action(action: str, entity_type: str, entity_id: int, performed_by: str,
         # Validate entity_id is an integer
         validate_int(entity_id, "entity_id")
 
-        # Insert into audit_logs
-        """Log an action performed on an entity."""
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO audit_logs (action, entity_type, entity_id, performed_by, timestamp, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (action, entity_type, entity_id, performed_by, datetime.utcnow().isoformat(), notes))
-
-
-        conn.commit()
-        conn.close()
+        entry = (
+            action,
+            entity_type,
+            entity_id,
+            str(performed_by),
+            datetime.now(timezone.utc).isoformat(),
+            notes
+        )
+        get_read_connection().call_after_commit(lambda: audit_sink.submit(entry))
 
         return {"message": "Action logged successfully"}
 
@@ -49,4 +205,72 @@ def log_action(action: str, entity_type: str, entity_id: int, performed_by: str,
         return {"error": ve.message}, ve.status_code
 
     except Exception as e:
-        return {"error": f"Database error: {str(e)}"}
\ No newline at end of file
+        return {"error": f"Database error: {str(e)}"}
+
+
+def log_actions(action: str, entity_type: str, entity_ids: list[int], performed_by: str, notes: str = None):
+    """
+    Log the same action for many entities (bulk operations).
+
+    Entries follow the same commit rules as log_action and reach the sink
+    together, so they are written in as few batches as possible.
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+    entries = [
+        (action, entity_type, entity_id, str(performed_by), timestamp, notes)
+        for entity_id in entity_ids
+    ]
+
+    get_read_connection().call_after_commit(lambda: audit_sink.submit_many(entries))
+
+
+# Audit history filters: query arg -> SQL clause
+AUDIT_LOG_FILTERS = {
+    "entity_type": "entity_type = ?",
+    "entity_id": "entity_id = ?",
+    "performed_by": "performed_by = ?",
+    "action": "action = ?",
+    "since": "timestamp >= ?",
+    "until": "timestamp < ?",
+}
+
+def get_audit_logs(
+    filters: Optional[Dict[str, Any]] = None,
+    after: Optional[tuple] = None,
+    limit: Optional[int] = None
+) -> list[Dict[str, Any]]:
+    """
+    Return audit rows, newest first.
+
+    Parameters:
+        filters (dict): Optional keys from AUDIT_LOG_FILTERS.
+        after (tuple): Keyset cursor (timestamp, id); only older rows are returned.
+        limit (int): Maximum number of rows; None returns every match.
+    """
+    conditions = []
+    params = []
+
+    for key, clause in AUDIT_LOG_FILTERS.items():
+        value = (filters or {}).get(key)
+        if value not in (None, ""):
+            conditions.append(clause)
+            params.append(value)
+
+    if after is not None:
+        conditions.append("(timestamp, id) < (?, ?)")
+        params.extend(after)
+
+    query = f"""
+        SELECT id, action, entity_type, entity_id, performed_by, timestamp, notes
+        FROM audit_logs
+        {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+        ORDER BY timestamp DESC, id DESC
+    """
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    with get_read_connection() as conn:
+        rows = conn.execute(query, params).fetchall()
+
+    return [dict(row) for row in rows]
@@ -0,0 +1,179 @@
+"""
+Audit log archive: gzip-compressed NDJSON segments, one per UTC day.
+
+Segments are append-only. Every archiving pass appends a new gzip member
+(gzip readers concatenate members transparently), and `manifest.json`
+records each segment's committed byte size, row count, highest row id and
+time range. A pass goes in this order: append and fsync the segment, then
+atomically replace the manifest, then delete the rows from SQLite.
+
+After a crash at any point, the next pass first truncates bytes the
+manifest never recorded. It then skips rows whose id is already covered
+by the segment, so rows are neither lost nor duplicated.
+"""
+import gzip
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Iterator
+from backend.config.config import Config
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .base import DataBase, get_read_connection, transaction
+from .writer import serialized_write
+
+MANIFEST_NAME = "manifest.json"
+
+_archive_lock = threading.Lock()
+
+
+@contextmanager
+def _exclusive(directory: str):
+    """Serialize archiving passes across threads and worker processes."""
+    with _archive_lock, open(os.path.join(directory, "archive.lock"), "a") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def archive_dir() -> str:
+    return Config.AUDIT_ARCHIVE_DIR or os.path.join(os.path.dirname(os.path.abspath(DataBase)), "audit_archive")
+
+
+def segment_name(day: str) -> str:
+    return f"audit-{day}.ndjson.gz"
+
+
+def load_manifest(directory: str = None) -> Dict[str, Any]:
+    """Return {"segments": {day: entry}}; empty when nothing was archived yet."""
+    path = os.path.join(directory or archive_dir(), MANIFEST_NAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"segments": {}}
+
+
+def _save_manifest(directory: str, manifest: Dict[str, Any]):
+    path = os.path.join(directory, MANIFEST_NAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _append_segment(directory: str, day: str, entry: Optional[Dict[str, Any]], rows: list) -> Dict[str, Any]:
+    """Append rows as one gzip member and return the updated manifest entry."""
+    entry = dict(entry or {"file": segment_name(day), "size": 0, "rows": 0, "max_id": 0})
+    path = os.path.join(directory, entry["file"])
+
+    with open(path, "ab") as f:
+        # Drop a tail left by a pass that crashed before recording it
+        if f.tell() != entry["size"]:
+            f.truncate(entry["size"])
+            f.seek(entry["size"])
+        payload = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows)
+        f.write(gzip.compress(payload.encode("utf-8")))
+        f.flush()
+        os.fsync(f.fileno())
+        entry["size"] = f.tell()
+
+    timestamps = [row["timestamp"] for row in rows]
+    entry["rows"] += len(rows)
+    entry["max_id"] = max(entry["max_id"], max(row["id"] for row in rows))
+    entry["min_timestamp"] = min([entry.get("min_timestamp") or timestamps[0], *timestamps])
+    entry["max_timestamp"] = max([entry.get("max_timestamp") or timestamps[0], *timestamps])
+    return entry
+
+
+@serialized_write
+def _delete_archived(ids: list):
+    with transaction() as conn:
+        conn.execute(f"DELETE FROM audit_logs WHERE id IN ({','.join('?' * len(ids))})", ids)
+
+
+def archive_audit_logs(older_than_days: int = None, chunk_size: int = None, directory: str = None) -> Dict[str, Any]:
+    """
+    Move audit rows from before the retention cutoff into day segments.
+
+    The cutoff is UTC midnight older_than_days days ago, so only whole days
+    are archived. Rows go in id order, chunk_size rows at a time, each chunk
+    deleted in its own short transaction.
+    """
+    older_than_days = Config.AUDIT_RETENTION_DAYS if older_than_days is None else older_than_days
+    chunk_size = chunk_size or Config.AUDIT_ARCHIVE_CHUNK_SIZE
+    directory = directory or archive_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    cutoff = (today - timedelta(days=older_than_days)).isoformat()
+
+    archived = 0
+    days = set()
+    with _exclusive(directory):
+        manifest = load_manifest(directory)
+        segments = manifest["segments"]
+
+        while True:
+            with get_read_connection() as conn:
+                rows = [
+                    dict(row) for row in conn.execute("""
+                        SELECT id, action, entity_type, entity_id, performed_by, timestamp, notes
+                        FROM audit_logs
+                        WHERE timestamp < ?
+                        ORDER BY id
+                        LIMIT ?
+                    """, (cutoff, chunk_size))
+                ]
+            if not rows:
+                break
+
+            by_day = {}
+            for row in rows:
+                day = row["timestamp"][:10]
+                # Rows at or below max_id were appended by a pass that crashed before deleting them
+                if row["id"] > segments.get(day, {}).get("max_id", 0):
+                    by_day.setdefault(day, []).append(row)
+
+            for day, day_rows in by_day.items():
+                segments[day] = _append_segment(directory, day, segments.get(day), day_rows)
+                archived += len(day_rows)
+                days.add(day)
+            _save_manifest(directory, manifest)
+
+            _delete_archived([row["id"] for row in rows])
+
+    return {"archived": archived, "cutoff": cutoff, "segments": sorted(days)}
+
+
+def iter_archived_audit_logs(since: str = None, until: str = None, directory: str = None) -> Iterator[list]:
+    """
+    Yield the rows of each segment overlapping [since, until), newest day
+    first. Each item is one day's rows sorted by (timestamp, id) descending.
+    Days never overlap, so every row of a later item is older than every
+    row of an earlier one.
+    """
+    directory = directory or archive_dir()
+    segments = load_manifest(directory)["segments"]
+
+    for day in sorted(segments, reverse=True):
+        entry = segments[day]
+        if since and entry["max_timestamp"] < since:
+            break
+        if until and entry["min_timestamp"] >= until:
+            continue
+
+        with open(os.path.join(directory, entry["file"]), "rb") as f:
+            # Ignore any unrecorded tail from an interrupted pass
+            data = gzip.decompress(f.read(entry["size"]))
+        rows = [json.loads(line) for line in data.decode("utf-8").splitlines() if line]
+        rows.sort(key=lambda row: (row["timestamp"], row["id"]), reverse=True)
+        yield rows
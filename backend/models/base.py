@@ -1,115 +1,342 @@
+import logging
 import sqlite3
 import os
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from backend.config.config import Config
+from .migrations import apply_migrations
+
+logger = logging.getLogger(__name__)
+
+DataBase = os.environ.get(
+    "DATABASE_PATH",
+    os.path.join(os.path.dirname(__file__), "database.db")
+)
+
+
+class QueryStats(threading.local):
+    """Per-thread SQL counters; request middleware resets and reads them."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.queries = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+
+query_stats = QueryStats()
+
+
+class InstrumentedCursor:
+    """
+    sqlite3 cursor wrapper feeding query_stats: statements executed, rows
+    fetched or changed, and time spent in execute and fetch calls.
+    """
+
+    __slots__ = ("_cursor",)
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def _executed(self, started: float):
+        query_stats.queries += 1
+        query_stats.seconds += time.perf_counter() - started
+        if self._cursor.rowcount > 0:
+            query_stats.rows += self._cursor.rowcount
+
+    def _fetched(self, started: float, count: int):
+        query_stats.seconds += time.perf_counter() - started
+        query_stats.rows += count
+
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        self._cursor.execute(sql, parameters)
+        self._executed(started)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        self._cursor.executemany(sql, seq_of_parameters)
+        self._executed(started)
+        return self
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(started, row is not None)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(self._cursor.arraysize if size is None else size)
+        self._fetched(started, len(rows))
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(started, len(rows))
+        return rows
+
+    def __iter__(self):
+        while True:
+            started = time.perf_counter()
+            row = self._cursor.fetchone()
+            self._fetched(started, row is not None)
+            if row is None:
+                return
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class PooledConnection:
+    """
+    Thread-bound handle around a long-lived sqlite3 connection.
+
+    Used as a context manager it commits on success and rolls back on error.
+    Nested `with` blocks on the same thread share the connection and only the
+    outermost block ends the transaction; if any nested block fails, the whole
+    transaction is rolled back even when the caller swallowed the error.
+    `close()` releases the handle back to the pool instead of closing the
+    underlying connection.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self._depth = 0
+        self._rollback_only = False
+        self._after_commit = []
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if exc_type is not None:
+            self._rollback_only = True
+        if self._depth == 0:
+            failed, self._rollback_only = self._rollback_only, False
+            callbacks, self._after_commit = self._after_commit, []
+            if not failed:
+                self._conn.commit()
+                # The transaction is durable now; a failing callback must not
+                # be reported as if it had rolled back.
+                for callback in callbacks:
+                    try:
+                        callback()
+                    except Exception:
+                        logger.exception("after-commit callback failed")
+                return False
+            self._conn.rollback()
+            if exc_type is None:
+                raise sqlite3.OperationalError("Transaction rolled back after a nested failure")
+        return False
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def cursor(self) -> InstrumentedCursor:
+        return InstrumentedCursor(self._conn.cursor())
+
+    def execute(self, sql, parameters=()) -> InstrumentedCursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters) -> InstrumentedCursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Isolate one unit of work inside the open transaction.
+
+        If the unit raises, or a nested block inside it failed and the error
+        was swallowed, only the unit's own writes and after-commit callbacks
+        are undone; the surrounding transaction carries on.
+        """
+        callbacks = len(self._after_commit)
+        rollback_only = self._rollback_only
+        self._conn.execute("SAVEPOINT write_unit")
+
+        def undo():
+            self._conn.execute("ROLLBACK TO write_unit")
+            self._conn.execute("RELEASE write_unit")
+            del self._after_commit[callbacks:]
+            self._rollback_only = rollback_only
+
+        try:
+            yield self
+        except BaseException:
+            undo()
+            raise
+        if self._rollback_only and not rollback_only:
+            undo()
+        else:
+            self._conn.execute("RELEASE write_unit")
+
+    def call_after_commit(self, callback):
+        """Run callback once the current transaction commits; drop it on rollback."""
+        if self._depth == 0:
+            callback()
+        else:
+            self._after_commit.append(callback)
+
+    def close(self):
+        """Release the handle. Uncommitted work outside a `with` block is discarded."""
+        if self._depth == 0 and self._conn.in_transaction:
+            self._conn.rollback()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class ConnectionPool:
+    """
+    One pre-configured connection per thread, per process.
+
+    Connections are opened lazily, configured once (WAL, synchronous, busy
+    timeout, foreign keys, statement cache) and reused for the lifetime of
+    the thread; connections of exited threads are closed the next time a
+    thread opens one. The owning pid is tracked so a forked worker never
+    reuses a connection inherited from its parent.
+    """
+
+    def __init__(self, database: str, read_only: bool = False):
+        self.database = database
+        self.read_only = read_only
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only:
+            # mode=ro: the connection can never take the write lock
+            target = f"file:{urllib.parse.quote(os.path.abspath(self.database))}?mode=ro"
+        else:
+            target = self.database
+        conn = sqlite3.connect(
+            target,
+            timeout=Config.DB_BUSY_TIMEOUT_MS / 1000,
+            cached_statements=Config.DB_CACHED_STATEMENTS,
+            check_same_thread=False,
+            uri=self.read_only
+        )
+        conn.row_factory = sqlite3.Row
+        if not self.read_only:
+            conn.execute(f"PRAGMA journal_mode = {Config.DB_JOURNAL_MODE}")
+            conn.execute(f"PRAGMA synchronous = {Config.DB_SYNCHRONOUS}")
+        conn.execute(f"PRAGMA busy_timeout = {int(Config.DB_BUSY_TIMEOUT_MS)}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def acquire(self) -> PooledConnection:
+        pid = os.getpid()
+        handle = getattr(self._local, "handle", None)
+        if handle is None or self._local.pid != pid:
+            handle = PooledConnection(self._connect())
+            self._local.handle = handle
+            self._local.pid = pid
+            with self._lock:
+                self._prune(pid)
+                self._connections.append((pid, threading.current_thread(), handle))
+        return handle
+
+    def _prune(self, pid: int):
+        # Forget connections inherited from a parent process and close those
+        # of threads that have exited (the dev server runs each request on a
+        # new thread). Caller holds self._lock.
+        live = []
+        for owner, thread, handle in self._connections:
+            if owner != pid:
+                continue
+            if thread.is_alive():
+                live.append((owner, thread, handle))
+            else:
+                handle._conn.close()
+        self._connections = live
+
+    def open_count(self) -> int:
+        """Connections this process currently holds open."""
+        pid = os.getpid()
+        with self._lock:
+            self._prune(pid)
+            return len(self._connections)
+
+    def peek(self):
+        """This thread's connection if it already has one, without opening it."""
+        handle = getattr(self._local, "handle", None)
+        if handle is None or self._local.pid != os.getpid():
+            return None
+        return handle
+
+    def close_all(self):
+        """Close every connection opened by this process (shutdown / tests)."""
+        pid = os.getpid()
+        with self._lock:
+            for owner, _, handle in self._connections:
+                if owner == pid:
+                    handle._conn.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+_pool = ConnectionPool(DataBase)
+_read_pool = ConnectionPool(DataBase, read_only=True)
 
-DataBase = os.path.join(os.path.dirname(__file__), "database.db")
 
 # Function to get a database connection
-def get_db_connection():
-    conn = sqlite3.connect(DataBase)
-    conn.row_factory = sqlite3.Row
-    return conn
+def get_db_connection() -> PooledConnection:
+    """Return this thread's pooled connection, usable as a transaction context manager."""
+    return _pool.acquire()
 
-def init_db():
+
+def get_read_connection() -> PooledConnection:
+    """
+    Connection for read-only queries.
+
+    With DB_WRITE_MODE = "queue" this is a per-thread `mode=ro` connection,
+    so readers never compete for the write lock. Inside an open transaction
+    (including write units run by the writer thread) the transaction's own
+    connection is returned instead, so a unit reads its own writes.
+    """
+    handle = _pool.peek()
+    if handle is not None and handle.depth > 0:
+        return handle
+    if Config.DB_WRITE_MODE != "queue":
+        return _pool.acquire()
+    return _read_pool.acquire()
+
+
+@contextmanager
+def transaction():
+    """
+    Unit of work spanning every model call made inside it.
+
+    Opens the thread's pooled connection with BEGIN IMMEDIATE so the write
+    lock is taken up front; nested get_db_connection()/transaction() blocks
+    join it, and everything is committed once when the outermost block exits.
+    """
     conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # USERS TABLE
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL DEFAULT 'user',
-            created_at TEXT NOT NULL
-        );
-    """)
-
-    # LOST ITEMS TABLE
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS lost_items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT NOT NULL,
-            item_type TEXT NOT NULL,
-            color TEXT,
-            brand TEXT,
-            last_seen_location TEXT NOT NULL,
-            last_seen_datetime TEXT NOT NULL,
-            public_description TEXT,
-            private_details TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'published',
-            created_at TEXT NOT NULL
-        );
-    """)
-
-    # FOUND ITEMS TABLE
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS found_items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT NOT NULL,
-            item_type TEXT NOT NULL,
-            color TEXT,
-            brand TEXT,
-            found_location TEXT NOT NULL,
-            found_datetime TEXT NOT NULL,
-            public_description TEXT,
-            status TEXT NOT NULL DEFAULT 'published',
-            created_at TEXT NOT NULL
-        );
-    """)
-
-    # CLAIMS TABLE
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS claims (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            found_item_id INTEGER NOT NULL,
-            claimed_category TEXT,
-            claimed_item_type TEXT,
-            claimed_brand TEXT,
-            claimed_color TEXT,
-            claimed_location TEXT,
-            claimed_private_details TEXT,
-            score INTEGER,
-            status TEXT DEFAULT 'pending',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (found_item_id) REFERENCES found_items(id)
-        );
-    """)
-
-    # ADMINS TABLE
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS admins (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL UNIQUE,
-            password_hash TEXT NOT NULL,
-            created_at TEXT NOT NULL
-        );
-    """)
-
-    # AUDIT LOGS TABLE
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS audit_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            action TEXT NOT NULL,
-            entity_type TEXT NOT NULL,
-            entity_id INTEGER NOT NULL,
-            performed_by TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            notes TEXT 
-        );
-    """)
-
-    # ADMIN ACTIONS TABLE
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS admin_actions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            admin_username TEXT NOT NULL,
-            claim_id INTEGER NOT NULL,
-            action TEXT NOT NULL,
-            notes TEXT,
-            timestamp TEXT NOT NULL
-        );
-    """)
-
-    conn.commit()
-    conn.close()
+    with conn:
+        if conn.depth == 1 and not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        yield conn
+
+
+def close_db_connections():
+    """Close all pooled connections for the current process."""
+    _pool.close_all()
+    _read_pool.close_all()
 
+
+def init_db():
+    """Apply any pending schema migrations; a no-op when the schema is current."""
+    conn = get_db_connection()
+    return apply_migrations(conn)
@@ -0,0 +1,208 @@
+"""
+Read-through cache for hot model lookups.
+
+Backends share one small interface (get / set / delete / clear) so the
+in-process LRU can be swapped for a store shared by every worker on a host.
+Callers put a version in their keys (e.g. a table change counter) when a
+write must retire many entries at once without enumerating them.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from backend.config.config import Config
+
+
+class CacheBackend:
+    """Interface for cache stores. Values must be JSON-serializable."""
+
+    def get(self, key: str):
+        raise NotImplementedError
+
+    def set(self, key: str, value, ttl: float = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class NullCache(CacheBackend):
+    """Caching disabled: every lookup misses."""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe LRU with per-entry TTL, private to one process."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class FileCache(CacheBackend):
+    """
+    Host-local cache shared by every worker process: one JSON file per key
+    in a directory, written atomically with os.replace. Expired entries are
+    swept from the directory at most every sweep_interval seconds, on a
+    write. A stand-in for a networked cache.
+    """
+
+    def __init__(self, directory: str, ttl: float = 30.0, sweep_interval: float = 60.0):
+        self.directory = directory
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self._swept_at = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def _read(self, path):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, entry):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(entry, fh, default=str)
+        os.replace(tmp, path)
+
+    def get(self, key):
+        entry = self._read(self._path(key))
+        if entry is None:
+            return None
+        if entry["expires"] is not None and entry["expires"] < time.time():
+            self.delete(key)
+            return None
+        return entry["value"]
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        self._write(self._path(key), {"expires": time.time() + ttl if ttl else None, "value": value})
+        if time.monotonic() - self._swept_at >= self.sweep_interval:
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Remove expired entries and stale temp files; returns files removed."""
+        self._swept_at = time.monotonic()
+        now = time.time()
+        removed = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                data = self._read(entry.path)
+                stale = data is not None and data["expires"] is not None and data["expires"] < now
+            elif entry.name.endswith(".tmp"):
+                # Left by a writer that died between mkstemp and os.replace
+                try:
+                    stale = entry.stat().st_mtime < now - self.sweep_interval
+                except FileNotFoundError:
+                    continue
+            else:
+                continue
+            if stale:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+
+def build_cache(backend: str = None) -> CacheBackend:
+    """Create the backend named by Config.CACHE_BACKEND (memory, file or none)."""
+    backend = (backend or Config.CACHE_BACKEND).lower()
+    if backend == "none":
+        return NullCache()
+    if backend == "file":
+        return FileCache(Config.CACHE_DIR, ttl=Config.CACHE_TTL, sweep_interval=Config.CACHE_SWEEP_INTERVAL)
+    if backend == "memory":
+        return MemoryCache(max_entries=Config.CACHE_MAX_ENTRIES, ttl=Config.CACHE_TTL)
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+cache = build_cache()
+
+
+def set_cache(backend: CacheBackend):
+    """Swap the active backend (tests, or wiring a shared store at startup)."""
+    global cache
+    cache = backend
+
+
+def get_cache() -> CacheBackend:
+    return cache
+
+
+def make_key(*parts) -> str:
+    """Stable cache key from JSON-serializable parts."""
+    return ":".join(
+        part if isinstance(part, str) else json.dumps(part, sort_keys=True, separators=(",", ":"))
+        for part in parts
+    )
+
@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+from .base import get_db_connection, get_read_connection
+from .writer import serialized_write
+
+def get_checkpoint(name: str) -> Optional[Dict[str, Any]]:
+    """Return the saved checkpoint for a job, or None."""
+    with get_read_connection() as conn:
+        row = conn.execute(
+            "SELECT name, position, fingerprint, updated_at FROM job_checkpoints WHERE name = ?",
+            (name,)
+        ).fetchone()
+        return dict(row) if row else None
+
+@serialized_write
+def save_checkpoint(name: str, position: int, fingerprint: str = None):
+    """
+    Upsert a job checkpoint. Call it inside the transaction that did the work
+    so progress and checkpoint commit together.
+    """
+    with get_db_connection() as conn:
+        conn.execute("""
+            INSERT INTO job_checkpoints (name, position, fingerprint, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                position = excluded.position,
+                fingerprint = excluded.fingerprint,
+                updated_at = excluded.updated_at
+        """, (name, position, fingerprint, datetime.now(timezone.utc).isoformat()))
+
+@serialized_write
+def clear_checkpoint(name: str):
+    """Forget a job's progress."""
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM job_checkpoints WHERE name = ?", (name,))
@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
-from .audit import log_action
+from typing import Optional, Dict, Any
+from .audit import log_action, log_actions
 from .items import get_found_item_by_id
 from backend.services.claim_scoring import compute_claim_score
-from .base import get_db_connection
+from .base import get_db_connection, get_read_connection, transaction
+from .writer import serialized_write
 from .validators import (
     ValidationError,
     require_fields,
@@ -13,52 +15,55 @@ from .validators import (
 import json
 
 # CREATE CLAIM
+@serialized_write
 def create_claim(data):
     """Create a claim with score computation and validation."""
     try:
         require_fields(data, ["found_item_id"])
         validate_found_item_id(data["found_item_id"])
 
-        found_item = get_found_item_by_id(data["found_item_id"])
-        if not found_item:
-            return {"error": "Found item not found"}, 404
+        # Item lookup and insert share one connection and one commit; the audit
+        # row goes to the async sink after commit, in its own transaction
+        with transaction() as conn:
+            found_item = get_found_item_by_id(data["found_item_id"])
+            if not found_item:
+                return {"error": "Found item not found"}, 404
 
-        score = compute_claim_score(data, found_item)
-        if isinstance(score, dict):
-            score = score.get("total", 0) 
+            score = compute_claim_score(data, found_item)
+            if isinstance(score, dict):
+                score = score.get("total", 0) 
             
-        ALLOWED_FIELDS = {
-            "found_item_id",
-            "claimed_category",
-            "claimed_item_type",
-            "claimed_brand",
-            "claimed_color",
-            "claimed_location",
-            "claimed_private_details"
-        }
-
-        fields, placeholders, values = [], [], []
-
-        for key, value in data.items():
-            if key in ALLOWED_FIELDS:
-                if isinstance(value, (dict, list)):
-                    value = json.dumps(value)
-                fields.append(key)
-                placeholders.append("?")
-                values.append(value)
+            ALLOWED_FIELDS = {
+                "found_item_id",
+                "claimed_category",
+                "claimed_item_type",
+                "claimed_brand",
+                "claimed_color",
+                "claimed_location",
+                "claimed_private_details"
+            }
+
+            fields, placeholders, values = [], [], []
+
+            for key, value in data.items():
+                if key in ALLOWED_FIELDS:
+                    if isinstance(value, (dict, list)):
+                        value = json.dumps(value)
+                    fields.append(key)
+                    placeholders.append("?")
+                    values.append(value)
+
+            fields.extend(["score", "status", "created_at"])
+            placeholders.extend(["?", "?", "?"])
+            values.extend([score, "pending", datetime.now(timezone.utc).isoformat()])
 
-        fields.extend(["score", "status", "created_at"])
-        placeholders.extend(["?", "?", "?"])
-        values.extend([score, "pending", datetime.now(timezone.utc).isoformat()])
-
-        with get_db_connection() as conn:
             cursor = conn.cursor()
             query = f"INSERT INTO claims ({', '.join(fields)}) VALUES ({', '.join(placeholders)})"
             cursor.execute(query, values)
             claim_id = cursor.lastrowid
 
-        # Log creation action
-        log_action("create", "claim", claim_id, data.get("claimed_by", "system"))
+            # Log creation action
+            log_action("create", "claim", claim_id, data.get("claimed_by", "system"))
 
         return {
             "message": "Claim submitted successfully", 
@@ -70,66 +75,217 @@ def create_claim(data):
         return {"error": ve.message}, ve.status_code
 
     except Exception as e:
-        return {"error": f"Database error: {str(e)}"}
+        return {"error": f"Database error: {str(e)}"}, 500
 
 # GET PENDING CLAIMS
+PENDING_CLAIMS_SELECT = """
+    SELECT
+        c.id AS claim_id,
+        c.found_item_id,
+        c.claimed_category,
+        c.claimed_item_type,
+        c.claimed_brand,
+        c.claimed_color,
+        c.claimed_location,
+        c.claimed_private_details,
+        c.score,
+        c.status,
+        c.created_at,
+
+        f.category AS found_category,
+        f.item_type AS found_item_type,
+        f.brand AS found_brand,
+        f.color AS found_color,
+        f.found_location,
+        f.public_description
+    FROM claims c
+    JOIN found_items f ON c.found_item_id = f.id
+"""
+
+PENDING_CLAIMS_QUERY = PENDING_CLAIMS_SELECT + """
+    WHERE c.status = 'pending'
+    ORDER BY c.created_at ASC
+"""
+
+# Review queue filters: query arg -> SQL clause
+CLAIM_QUEUE_FILTERS = {
+    "category": "f.category = ? COLLATE NOCASE",
+    "found_item_id": "c.found_item_id = ?",
+    "min_score": "c.score >= ?",
+}
+
+# Review queue orderings: name -> (ORDER BY, cursor size)
+CLAIM_QUEUE_SORTS = {
+    # Highest score first, oldest first within a score; unscored claims last
+    "score": ("c.score DESC, c.created_at ASC, c.id ASC", 3),
+    "created": ("c.created_at ASC, c.id ASC", 2),
+}
+
 def get_pending_claims():
     """Return all pending claims with found item info."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-        SELECT
-            c.id AS claim_id,
-            c.found_item_id,
-            c.claimed_category,
-            c.claimed_item_type,
-            c.claimed_brand,
-            c.claimed_color,
-            c.claimed_location,
-            c.claimed_private_details,
-            c.score,
-            c.status,
-            c.created_at,
-
-            f.category AS found_category,
-            f.item_type AS found_item_type,
-            f.brand AS found_brand,
-            f.color AS found_color,
-            f.found_location,
-            f.public_description
-        FROM claims c
-        JOIN found_items f ON c.found_item_id = f.id
-        WHERE c.status = 'pending'
-        ORDER BY c.created_at ASC
+    with get_read_connection() as conn:
+        rows = conn.execute(PENDING_CLAIMS_QUERY).fetchall()
+
+    return [dict(row) for row in rows]
+
+def iter_pending_claims(batch_size: int = 500, filters: Optional[Dict[str, Any]] = None, sort: str = "created"):
+    """Yield pending claims with found item info, fetching batch_size rows at a time."""
+    query, params = _claim_queue_query(filters, sort)
+
+    with get_read_connection() as conn:
+        cursor = conn.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+
+def get_claim_review_queue(
+    filters: Optional[Dict[str, Any]] = None,
+    sort: str = "score",
+    after: Optional[tuple] = None,
+    limit: Optional[int] = None
+) -> list[Dict[str, Any]]:
+    """
+    Return one page of pending claims with found item info.
+
+    Parameters:
+        filters (dict): Optional keys from CLAIM_QUEUE_FILTERS.
+        sort (str): Key of CLAIM_QUEUE_SORTS.
+        after (tuple): Keyset cursor - (score, created_at, id) for "score",
+            (created_at, id) for "created"; only later rows are returned.
+        limit (int): Maximum number of rows; None returns every match.
+    """
+    query, params = _claim_queue_query(filters, sort, after, limit)
+
+    with get_read_connection() as conn:
+        rows = conn.execute(query, params).fetchall()
+
+        # A score cursor only reaches scored rows; fill the page from the
+        # unscored block that sorts after them
+        if sort == "score" and after is not None and after[0] is not None:
+            remaining = None if limit is None else limit - len(rows)
+            if remaining is None or remaining > 0:
+                query, params = _claim_queue_query(filters, sort, (None, None, None), remaining)
+                rows += conn.execute(query, params).fetchall()
+
+    return [dict(row) for row in rows]
+
+def _claim_queue_query(filters=None, sort="created", after=None, limit=None) -> tuple:
+    if sort not in CLAIM_QUEUE_SORTS:
+        raise ValidationError(f"sort must be one of: {', '.join(CLAIM_QUEUE_SORTS)}", 400)
+    order_by, _ = CLAIM_QUEUE_SORTS[sort]
+
+    conditions = ["c.status = 'pending'"]
+    params = []
+
+    for key, clause in CLAIM_QUEUE_FILTERS.items():
+        value = (filters or {}).get(key)
+        if value not in (None, ""):
+            conditions.append(clause)
+            params.append(value)
+
+    if after is not None and sort == "created":
+        conditions.append("(c.created_at, c.id) > (?, ?)")
+        params.extend(after)
+    elif after is not None:
+        score, created_at, claim_id = after
+        if score is None:
+            # Inside the trailing unscored block; (None, None, None) is its start
+            conditions.append("c.score IS NULL")
+            if created_at is not None:
+                conditions.append("(c.created_at, c.id) > (?, ?)")
+                params.extend([created_at, claim_id])
+        else:
+            # Scored rows only, written so the index serves it as a score range;
+            # get_claim_review_queue reads the unscored block separately
+            conditions.append("c.score <= ? AND (c.score < ? OR (c.created_at, c.id) > (?, ?))")
+            params.extend([score, score, created_at, claim_id])
+
+    query = f"""
+        {PENDING_CLAIMS_SELECT}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY {order_by}
     """
-    cursor.execute(query)
-    rows = cursor.fetchall()
-    conn.close()
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    return query, params
+
+# RESCORING
+def get_pending_claims_for_scoring(after_id: int = 0, limit: int = 1000):
+    """
+    Return the next chunk of pending claims (by id) with the found item
+    fields the scorer reads.
+    """
+    with get_read_connection() as conn:
+        rows = conn.execute("""
+            SELECT
+                c.id,
+                c.score,
+                c.claimed_category,
+                c.claimed_item_type,
+                c.claimed_brand,
+                c.claimed_color,
+                c.claimed_location,
+                c.claimed_private_details,
+                f.category,
+                f.item_type,
+                f.brand,
+                f.color,
+                f.found_location,
+                f.public_description
+            FROM claims c
+            JOIN found_items f ON c.found_item_id = f.id
+            WHERE c.status = 'pending' AND c.id > ?
+            ORDER BY c.id
+            LIMIT ?
+        """, (after_id, limit)).fetchall()
 
     return [dict(row) for row in rows]
 
+def count_pending_claims(after_id: int = 0) -> int:
+    with get_read_connection() as conn:
+        return conn.execute(
+            "SELECT COUNT(*) FROM claims WHERE status = 'pending' AND id > ?", (after_id,)
+        ).fetchone()[0]
+
+@serialized_write
+def update_claim_scores(scores: list[tuple]) -> int:
+    """
+    Write (score, claim_id) pairs with one executemany. Claims that left the
+    pending state meanwhile are not touched. Joins the caller's transaction.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.executemany(
+            "UPDATE claims SET score = ? WHERE id = ? AND status = 'pending'", scores
+        )
+        return cursor.rowcount
+
 # UPDATE CLAIM STATUS
+@serialized_write
 def update_claim_status(claim_id, new_status):
     """Update status of a claim with validation."""
     try:
         validate_int(claim_id, "claim_id")
 
-        with get_db_connection() as conn:
+        with transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT id FROM claims WHERE id = ?", (claim_id,))
             if not cursor.fetchone():
                 return {"error": "Claim not found"}, 404
 
             cursor.execute("UPDATE claims SET status = ? WHERE id = ?", (new_status, claim_id))
-
-        log_action("update_status", "claim", claim_id, "system")
+            log_action("update_status", "claim", claim_id, "system")
         return {"message": "Claim status updated"}, 200
 
     except ValidationError as ve:
         return {"error": ve.message}, ve.status_code
 
 # UPDATE CLAIM
+@serialized_write
 def update_claim(claim_id, data):
     """Update claim fields with validation."""
     try:
@@ -158,25 +314,25 @@ def update_claim(claim_id, data):
 
         values.append(claim_id)
 
-        with get_db_connection() as conn:
+        with transaction() as conn:
             cursor = conn.cursor()
             query = f"UPDATE claims SET {', '.join(updates)} WHERE id = ?"
             cursor.execute(query, values)
-
-        log_action("update", "claim", claim_id, "system")
+            log_action("update", "claim", claim_id, "system")
         return {"message": "Claim updated successfully"}, 200
 
     except ValidationError as ve:
         return {"error": ve.message}, ve.status_code
 
 # VERIFY CLAIM
+@serialized_write
 def verify_claim(claim_id, decision, admin_username):
     """Approve or reject a claim and log the action."""
     try:
         validate_int(claim_id, "claim_id")
         validate_claim_decision(decision)
 
-        with get_db_connection() as conn:
+        with transaction() as conn:
             cursor = conn.cursor()
             row = cursor.execute("SELECT status FROM claims WHERE id = ?", (claim_id,)).fetchone()
             if not row:
@@ -185,12 +341,66 @@ def verify_claim(claim_id, decision, admin_username):
                 return {"error": "Claim already processed"}, 400
 
             cursor.execute("UPDATE claims SET status = ? WHERE id = ?", (decision, claim_id))
-
-        log_action(decision, "claim", claim_id, admin_username)
+            log_action(decision, "claim", claim_id, admin_username)
         return {"message": f"Claim {decision} successfully"}, 200
 
     except ValidationError as ve:
         return {"error": ve.message}, ve.status_code
 
     except Exception as e:
-        return {"error": f"Database error: {str(e)}"}
+        return {"error": f"Database error: {str(e)}"}, 500
+
+# Upper bound for verify_claims; keeps the IN (...) lists well under SQLite's variable limit
+MAX_VERIFY_BATCH = 500
+
+@serialized_write
+def verify_claims(claim_ids: list, decision: str, admin_username: str) -> tuple:
+    """
+    Approve or reject many claims in one transaction.
+
+    Pending claims are updated with a single conditional UPDATE and audited
+    in bulk; every id gets an outcome: the decision, "already_processed"
+    or "not_found".
+    """
+    try:
+        validate_claim_decision(decision)
+        if not isinstance(claim_ids, list) or not claim_ids:
+            raise ValidationError("claim_ids must be a non-empty list", 400)
+        claim_ids = list(dict.fromkeys(validate_int(claim_id, "claim_id") for claim_id in claim_ids))
+        if len(claim_ids) > MAX_VERIFY_BATCH:
+            raise ValidationError(f"At most {MAX_VERIFY_BATCH} claims can be verified at once", 400)
+
+        placeholders = ",".join("?" * len(claim_ids))
+        with transaction() as conn:
+            # BEGIN IMMEDIATE holds the write lock, so these statuses cannot change under us
+            statuses = {
+                row["id"]: row["status"]
+                for row in conn.execute(
+                    f"SELECT id, status FROM claims WHERE id IN ({placeholders})", claim_ids
+                )
+            }
+            conn.execute(
+                f"UPDATE claims SET status = ? WHERE status = 'pending' AND id IN ({placeholders})",
+                [decision, *claim_ids]
+            )
+            updated = [claim_id for claim_id in claim_ids if statuses.get(claim_id) == "pending"]
+            log_actions(decision, "claim", updated, admin_username)
+
+        results = []
+        for claim_id in claim_ids:
+            if claim_id not in statuses:
+                outcome = "not_found"
+            elif statuses[claim_id] != "pending":
+                outcome = "already_processed"
+            else:
+                outcome = decision
+            results.append({"claim_id": claim_id, "outcome": outcome})
+
+        return {"results": results, "updated": len(updated)}, 200
+
+    except ValidationError as ve:
+        return {"error": ve.message}, ve.status_code
+
+    except Exception as e:
+        return {"error": f"Database error: {str(e)}"}, 500
+
@@ -1,42 +1,49 @@
+import re
 from datetime import datetime, timezone
-from .base import get_db_connection
+from .base import get_read_connection, transaction
+from .writer import serialized_write
 from .validators import ValidationError, require_fields, validate_int
-from .audit import log_action
-from typing import Optional, Dict, Any
+from .audit import log_action, log_actions
+from . import cache as cache_module
+from .cache import make_key
+from .versions import get_table_versions
+from typing import Optional, Dict, Any, Iterator
 
 # Lost Items
+@serialized_write
 def create_lost_item(data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a lost item record with validation and logging."""
     try:
         # Validate required fields
         require_fields(data, ["category", "last_seen_location", "last_seen_datetime"])
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO lost_items (
-                category, item_type, last_seen_location,
-                last_seen_datetime, public_description, private_details,
-                status, created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            data["category"],
-            data.get("item_type", "Unknown"),
-            data["last_seen_location"],
-            data["last_seen_datetime"],
-            data.get("public_description"),
-            data.get("private_details"),
-            "published",
-            datetime.now(timezone.utc).isoformat()
-        ))
+            cursor.execute("""
+                INSERT INTO lost_items (
+                    category, item_type, color, brand, last_seen_location,
+                    last_seen_datetime, public_description, private_details,
+                    status, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                data["category"],
+                data.get("item_type", "Unknown"),
+                data.get("color"),
+                data.get("brand"),
+                data["last_seen_location"],
+                data["last_seen_datetime"],
+                data.get("public_description"),
+                data.get("private_details"),
+                "published",
+                datetime.now(timezone.utc).isoformat()
+            ))
 
-        conn.commit()
-        item_id = cursor.lastrowid
+            item_id = cursor.lastrowid
 
-        # Log creation
-        log_action("create", "lost_item", item_id, data.get("reported_by", "system"))
+            # Audit row is queued to the async sink once this transaction commits
+            log_action("create", "lost_item", item_id, data.get("reported_by", "system"))
 
         return {"message": "Lost item created successfully", "item_id": item_id}
 
@@ -46,42 +53,48 @@ def create_lost_item(data: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Database error: {str(e)}"}
 
-    finally:
-        conn.close()
+# Get Lost Item by ID
+def get_lost_item_by_id(item_id: int) -> Optional[Dict[str, Any]]:
+    """Return a lost item by ID. Validates ID type."""
+    validate_int(item_id, "item_id")
+
+    with get_read_connection() as conn:
+        row = conn.execute("SELECT * FROM lost_items WHERE id = ?", (item_id,)).fetchone()
+        return dict(row) if row else None
 
 # Found Items
+@serialized_write
 def create_found_item(data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a found item record with validation and logging."""
     try:
         require_fields(data, ["category", "found_location", "found_datetime"])
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO found_items (
-                category, item_type, color, brand,
-                found_location, found_datetime,
-                public_description, status, created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            data["category"],
-            data.get("item_type", "Unknown"),
-            data.get("color"),
-            data.get("brand"),
-            data["found_location"],
-            data["found_datetime"],
-            data.get("public_description"),
-            "published",
-            datetime.now(timezone.utc).isoformat()
-        ))
+            cursor.execute("""
+                INSERT INTO found_items (
+                    category, item_type, color, brand,
+                    found_location, found_datetime,
+                    public_description, status, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                data["category"],
+                data.get("item_type", "Unknown"),
+                data.get("color"),
+                data.get("brand"),
+                data["found_location"],
+                data["found_datetime"],
+                data.get("public_description"),
+                "published",
+                datetime.now(timezone.utc).isoformat()
+            ))
 
-        conn.commit()
-        item_id = cursor.lastrowid
+            item_id = cursor.lastrowid
 
-        # Log creation
-        log_action("create", "found_item", item_id, data.get("reported_by", "system"))
+            # Audit row is queued to the async sink once this transaction commits
+            log_action("create", "found_item", item_id, data.get("reported_by", "system"))
 
         return {"message": "Found item created successfully", "item_id": item_id}
 
@@ -91,34 +104,148 @@ def create_found_item(data: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Database error: {str(e)}"}
 
-    finally:
-        conn.close()
+@serialized_write
+def bulk_create_found_items(records: list[Dict[str, Any]], reported_by: str = "system") -> list[int]:
+    """
+    Insert already-validated found items with one executemany and one commit.
+
+    AUTOINCREMENT ids are assigned contiguously while the write lock is held,
+    so the new ids are derived from sqlite_sequence instead of per-row lastrowid.
+
+    Returns:
+        list[int]: IDs of the inserted items, in input order.
+    """
+    if not records:
+        return []
+
+    created_at = datetime.now(timezone.utc).isoformat()
+    rows = [
+        (
+            record["category"],
+            record.get("item_type") or "Unknown",
+            record.get("color"),
+            record.get("brand"),
+            record["found_location"],
+            record["found_datetime"],
+            record.get("public_description"),
+            "published",
+            created_at
+        )
+        for record in records
+    ]
+
+    with transaction() as conn:
+        before = _found_items_sequence(conn)
+        conn.executemany("""
+            INSERT INTO found_items (
+                category, item_type, color, brand,
+                found_location, found_datetime,
+                public_description, status, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        item_ids = list(range(before + 1, _found_items_sequence(conn) + 1))
+
+        log_actions("create", "found_item", item_ids, reported_by, notes="bulk import")
+
+    return item_ids
+
+def _found_items_sequence(conn) -> int:
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'found_items'").fetchone()
+    return row[0] if row else 0
 
 # Get Found Items
-def get_published_found_items() -> list[Dict[str, Any]]:
-    """Return all published found items."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+FOUND_ITEM_FILTERS = {
+    "category": "category = ? COLLATE NOCASE",
+    "item_type": "item_type = ? COLLATE NOCASE",
+    "color": "color = ? COLLATE NOCASE",
+    "found_after": "found_datetime >= ?",
+    "found_before": "found_datetime <= ?",
+}
+
+def get_published_found_items(
+    filters: Optional[Dict[str, Any]] = None,
+    after: Optional[tuple] = None,
+    limit: Optional[int] = None
+) -> list[Dict[str, Any]]:
+    """
+    Return published found items, newest first.
+
+    Parameters:
+        filters (dict): Optional keys from FOUND_ITEM_FILTERS.
+        after (tuple): Keyset cursor (created_at, id); only older rows are returned.
+        limit (int): Maximum number of rows; None returns every match.
+    """
+    key = make_key(FOUND_LIST_NAMESPACE, found_items_version(), filters or {}, after, limit)
+    items = cache_module.cache.get(key)
+    if items is not None:
+        return items
+
+    query, params = _published_found_items_query(filters, after, limit)
+
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        items = [dict(row) for row in cursor.fetchall()]
+
+    cache_module.cache.set(key, items)
+    return items
+
+def iter_published_found_items(
+    filters: Optional[Dict[str, Any]] = None,
+    batch_size: int = 500
+) -> Iterator[Dict[str, Any]]:
+    """Yield every published found item matching filters, fetching batch_size rows at a time."""
+    query, params = _published_found_items_query(filters)
+
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
 
-    cursor.execute("""
+def _published_found_items_query(filters=None, after=None, limit=None) -> tuple:
+    conditions = ["status = 'published'"]
+    params = []
+
+    for key, clause in FOUND_ITEM_FILTERS.items():
+        value = (filters or {}).get(key)
+        if value not in (None, ""):
+            conditions.append(clause)
+            params.append(value)
+
+    if after is not None:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend(after)
+
+    query = f"""
         SELECT id, category, item_type, color, brand,
-               found_location, found_datetime, public_description
+               found_location, found_datetime, public_description, created_at
         FROM found_items
-        WHERE status = 'published'
-        ORDER BY created_at DESC
-    """)
+        WHERE {' AND '.join(conditions)}
+        ORDER BY created_at DESC, id DESC
+    """
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
 
-    items = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return items
+    return query, params
 
 # Get Found Item by ID
 def get_found_item_by_id(item_id: int) -> Optional[Dict[str, Any]]:
-    """Return a found item by ID. Validates ID type."""
-    try:
-        validate_int(item_id, "item_id")
+    """Return a found item by ID (read-through cached). Validates ID type."""
+    item_id = validate_int(item_id, "item_id")
+    key = found_item_cache_key(item_id)
 
-        conn = get_db_connection()
+    item = cache_module.cache.get(key)
+    if item is not None:
+        return item
+
+    with get_read_connection() as conn:
         cursor = conn.cursor()
 
         cursor.execute("SELECT * FROM found_items WHERE id = ?", (item_id,))
@@ -127,7 +254,176 @@ def get_found_item_by_id(item_id: int) -> Optional[Dict[str, Any]]:
         if row is None:
             return None
 
-        return dict(row)
+        item = dict(row)
+
+    cache_module.cache.set(key, item)
+    return item
+
+# Update Found Item Status
+@serialized_write
+def update_found_item_status(item_id: int, new_status: str, performed_by: str = "system") -> tuple:
+    """Change a found item's status (e.g. published -> claimed)."""
+    try:
+        item_id = validate_int(item_id, "item_id")
+        require_fields({"status": new_status}, ["status"])
+
+        with transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE found_items SET status = ? WHERE id = ?", (new_status, item_id)
+            )
+            if cursor.rowcount == 0:
+                return {"error": "Found item not found"}, 404
+
+            log_action("update_status", "found_item", item_id, performed_by, notes=new_status)
+            conn.call_after_commit(lambda: invalidate_found_item(item_id))
+
+        return {"message": "Found item status updated"}, 200
+
+    except ValidationError as ve:
+        return {"error": ve.message}, ve.status_code
+
+# Found item cache
+# List keys carry the found_items change counter - the value list ETags are
+# built from - so a write by any worker or process retires every cached list,
+# and a response never pairs a new ETag with an old body. Retired lists age
+# out through the cache's TTL and LRU. Single items are keyed by id alone and
+# dropped after a write commits; a worker with its own memory cache sees the
+# change within CACHE_TTL.
+FOUND_LIST_NAMESPACE = "found:list"
+
+def found_items_version() -> int:
+    return get_table_versions("found_items")["found_items"]
+
+def found_item_cache_key(item_id: int) -> str:
+    return f"found:item:{item_id}"
+
+def invalidate_found_item(item_id: int):
+    """Drop the cached record for a found item after it was written."""
+    cache_module.cache.delete(found_item_cache_key(item_id))
+
+# Search Found Items
+# bm25 column weights: category, item_type, brand, color, found_location, public_description
+SEARCH_WEIGHTS = (2.0, 3.0, 3.0, 1.5, 1.0, 1.0)
+
+def build_fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query: every word must match, as a prefix.
+
+    "sams blac" -> '"sams"* "blac"*'. Words are quoted so FTS operators
+    typed by users are treated as plain text.
+    """
+    words = re.findall(r"\w+", text or "")
+    return " ".join(f'"{word}"*' for word in words)
+
+def search_found_items(text: str, after: Optional[tuple] = None, limit: int = 20) -> list[Dict[str, Any]]:
+    """
+    Full-text search over published found items, best bm25 match first.
+
+    Parameters:
+        text (str): User search text; each word is matched as a prefix.
+        after (tuple): Keyset cursor (rank, id) from the previous page.
+        limit (int): Maximum number of rows.
+    """
+    match = build_fts_query(text)
+    if not match:
+        raise ValidationError("Search query must contain at least one word", 400)
+
+    weights = ", ".join(str(w) for w in SEARCH_WEIGHTS)
+    params = [match]
+    keyset = ""
+    if after is not None:
+        keyset = "WHERE (rank, id) > (?, ?)"
+        params.extend(after)
+    params.append(limit)
+
+    query = f"""
+        SELECT * FROM (
+            SELECT f.id, f.category, f.item_type, f.color, f.brand,
+                   f.found_location, f.found_datetime, f.public_description,
+                   bm25(found_items_fts, {weights}) AS rank
+            FROM found_items_fts
+            JOIN found_items f ON f.id = found_items_fts.rowid
+            WHERE found_items_fts MATCH ?
+              AND f.status = 'published'
+        )
+        {keyset}
+        ORDER BY rank, id
+        LIMIT ?
+    """
+
+    with get_read_connection() as conn:
+        return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+# Candidate Found Items
+def find_found_item_candidates(terms: Dict[str, str], limit: int = 200) -> list[Dict[str, Any]]:
+    """
+    Look up published found items sharing at least one token with `terms`.
+
+    Uses the FTS5 inverted index column by column (e.g. brand tokens only
+    match the brand column), so only plausible rows are read.
+
+    Parameters:
+        terms (dict): Column name (category, item_type, brand, color) -> text.
+        limit (int): Maximum number of candidates, best bm25 match first.
+    """
+    clauses = []
+    for column, text in terms.items():
+        words = re.findall(r"\w+", text or "")
+        if words:
+            alternatives = " OR ".join(f'"{word}"*' for word in words)
+            clauses.append(f"{column} : ({alternatives})")
+
+    if not clauses:
+        return []
+
+    weights = ", ".join(str(w) for w in SEARCH_WEIGHTS)
+    with get_read_connection() as conn:
+        rows = conn.execute(f"""
+            SELECT f.*
+            FROM found_items_fts
+            JOIN found_items f ON f.id = found_items_fts.rowid
+            WHERE found_items_fts MATCH ?
+              AND f.status = 'published'
+            ORDER BY bm25(found_items_fts, {weights})
+            LIMIT ?
+        """, (" OR ".join(clauses), limit)).fetchall()
+        return [dict(row) for row in rows]
+
+# Similar Found Items (trigram index)
+def find_similar_found_items(terms: Dict[str, list], limit: int = 200) -> list[Dict[str, Any]]:
+    """
+    Look up published found items whose brand, color or found_location shares
+    character trigrams with any of the given spellings.
+
+    Backed by the found_items_trgm index, so misspellings ("Samsng") still
+    reach their candidates without a pairwise scan. Rows sharing the most
+    trigrams come first.
+
+    Parameters:
+        terms (dict): Column (brand, color, found_location) -> list of spellings.
+        limit (int): Maximum number of candidates.
+    """
+    clauses = []
+    for column, spellings in terms.items():
+        grams = set()
+        for text in spellings:
+            text = (text or "").strip().lower()
+            grams.update(text[i:i + 3] for i in range(len(text) - 2))
+        grams = sorted(g.replace('"', '""') for g in grams if g.strip())
+        if grams:
+            clauses.append(f"{column} : (" + " OR ".join(f'"{g}"' for g in grams) + ")")
+
+    if not clauses:
+        return []
 
-    finally:
-        conn.close()
+    with get_read_connection() as conn:
+        rows = conn.execute("""
+            SELECT f.*
+            FROM found_items_trgm
+            JOIN found_items f ON f.id = found_items_trgm.rowid
+            WHERE found_items_trgm MATCH ?
+              AND f.status = 'published'
+            ORDER BY bm25(found_items_trgm)
+            LIMIT ?
+        """, (" OR ".join(clauses), limit)).fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,378 @@
+"""
+Ordered schema migrations.
+
+Each entry is (version, description, statements). Versions are applied in
+order inside a single write transaction and recorded in `schema_version`;
+once the database is current, startup performs no DDL at all.
+"""
+import sqlite3
+from datetime import datetime, timezone
+
+
+def _change_counter_triggers(table: str) -> list:
+    """Triggers bumping table_versions.version for `table` on every insert, update and delete."""
+    return [
+        f"INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('{table}', 0)",
+    ] + [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} AFTER {event} ON {table} BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = '{table}';
+        END
+        """
+        for event in ("INSERT", "UPDATE", "DELETE")
+    ]
+
+
+MIGRATIONS = [
+    (
+        1,
+        "initial schema",
+        [
+            # USERS TABLE
+            """
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT UNIQUE NOT NULL,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL DEFAULT 'user',
+                created_at TEXT NOT NULL
+            )
+            """,
+            # LOST ITEMS TABLE
+            """
+            CREATE TABLE IF NOT EXISTS lost_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category TEXT NOT NULL,
+                item_type TEXT NOT NULL,
+                color TEXT,
+                brand TEXT,
+                last_seen_location TEXT NOT NULL,
+                last_seen_datetime TEXT NOT NULL,
+                public_description TEXT,
+                private_details TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'published',
+                created_at TEXT NOT NULL
+            )
+            """,
+            # FOUND ITEMS TABLE
+            """
+            CREATE TABLE IF NOT EXISTS found_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category TEXT NOT NULL,
+                item_type TEXT NOT NULL,
+                color TEXT,
+                brand TEXT,
+                found_location TEXT NOT NULL,
+                found_datetime TEXT NOT NULL,
+                public_description TEXT,
+                status TEXT NOT NULL DEFAULT 'published',
+                created_at TEXT NOT NULL
+            )
+            """,
+            # CLAIMS TABLE
+            """
+            CREATE TABLE IF NOT EXISTS claims (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                found_item_id INTEGER NOT NULL,
+                claimed_category TEXT,
+                claimed_item_type TEXT,
+                claimed_brand TEXT,
+                claimed_color TEXT,
+                claimed_location TEXT,
+                claimed_private_details TEXT,
+                score INTEGER,
+                status TEXT DEFAULT 'pending',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (found_item_id) REFERENCES found_items(id)
+            )
+            """,
+            # ADMINS TABLE
+            """
+            CREATE TABLE IF NOT EXISTS admins (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT NOT NULL UNIQUE,
+                password_hash TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """,
+            # AUDIT LOGS TABLE
+            """
+            CREATE TABLE IF NOT EXISTS audit_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                action TEXT NOT NULL,
+                entity_type TEXT NOT NULL,
+                entity_id INTEGER NOT NULL,
+                performed_by TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                notes TEXT 
+            )
+            """,
+            # ADMIN ACTIONS TABLE
+            """
+            CREATE TABLE IF NOT EXISTS admin_actions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                admin_username TEXT NOT NULL,
+                claim_id INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                notes TEXT,
+                timestamp TEXT NOT NULL
+            )
+            """,
+        ]
+    ),
+    (
+        2,
+        "indexes for published found items, pending claims and audit lookups",
+        [
+            # GET /api/found: WHERE status = ? ORDER BY created_at DESC, id DESC
+            """
+            CREATE INDEX IF NOT EXISTS idx_found_items_status_created
+            ON found_items (status, created_at, id)
+            """,
+            # Admin review queue: WHERE status = 'pending' ORDER BY created_at
+            """
+            CREATE INDEX IF NOT EXISTS idx_claims_status_created
+            ON claims (status, created_at)
+            """,
+            # JOIN claims -> found_items and per-item claim lookups
+            """
+            CREATE INDEX IF NOT EXISTS idx_claims_found_item
+            ON claims (found_item_id)
+            """,
+            # Audit history for a single entity
+            """
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_entity
+            ON audit_logs (entity_type, entity_id, timestamp)
+            """,
+        ]
+    ),
+    (
+        3,
+        "full-text search index over found items",
+        [
+            # External-content FTS5 table: the text lives in found_items only
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS found_items_fts USING fts5(
+                category, item_type, brand, color, found_location, public_description,
+                content='found_items',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS found_items_fts_ai AFTER INSERT ON found_items BEGIN
+                INSERT INTO found_items_fts (
+                    rowid, category, item_type, brand, color, found_location, public_description
+                )
+                VALUES (
+                    new.id, new.category, new.item_type, new.brand, new.color,
+                    new.found_location, new.public_description
+                );
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS found_items_fts_ad AFTER DELETE ON found_items BEGIN
+                INSERT INTO found_items_fts (
+                    found_items_fts, rowid, category, item_type, brand, color,
+                    found_location, public_description
+                )
+                VALUES (
+                    'delete', old.id, old.category, old.item_type, old.brand, old.color,
+                    old.found_location, old.public_description
+                );
+            END
+            """,
+            # Status changes do not touch the indexed columns, so they skip this
+            """
+            CREATE TRIGGER IF NOT EXISTS found_items_fts_au
+            AFTER UPDATE OF category, item_type, brand, color, found_location, public_description
+            ON found_items BEGIN
+                INSERT INTO found_items_fts (
+                    found_items_fts, rowid, category, item_type, brand, color,
+                    found_location, public_description
+                )
+                VALUES (
+                    'delete', old.id, old.category, old.item_type, old.brand, old.color,
+                    old.found_location, old.public_description
+                );
+                INSERT INTO found_items_fts (
+                    rowid, category, item_type, brand, color, found_location, public_description
+                )
+                VALUES (
+                    new.id, new.category, new.item_type, new.brand, new.color,
+                    new.found_location, new.public_description
+                );
+            END
+            """,
+            # Index rows that existed before this migration
+            "INSERT INTO found_items_fts (found_items_fts) VALUES ('rebuild')",
+        ]
+    ),
+    (
+        4,
+        "trigram index over found item brand, color and location",
+        [
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS found_items_trgm USING fts5(
+                brand, color, found_location,
+                content='found_items',
+                content_rowid='id',
+                tokenize='trigram'
+            )
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS found_items_trgm_ai AFTER INSERT ON found_items BEGIN
+                INSERT INTO found_items_trgm (rowid, brand, color, found_location)
+                VALUES (new.id, new.brand, new.color, new.found_location);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS found_items_trgm_ad AFTER DELETE ON found_items BEGIN
+                INSERT INTO found_items_trgm (found_items_trgm, rowid, brand, color, found_location)
+                VALUES ('delete', old.id, old.brand, old.color, old.found_location);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS found_items_trgm_au
+            AFTER UPDATE OF brand, color, found_location ON found_items BEGIN
+                INSERT INTO found_items_trgm (found_items_trgm, rowid, brand, color, found_location)
+                VALUES ('delete', old.id, old.brand, old.color, old.found_location);
+                INSERT INTO found_items_trgm (rowid, brand, color, found_location)
+                VALUES (new.id, new.brand, new.color, new.found_location);
+            END
+            """,
+            "INSERT INTO found_items_trgm (found_items_trgm) VALUES ('rebuild')",
+        ]
+    ),
+    (
+        5,
+        "checkpoints for resumable maintenance jobs",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS job_checkpoints (
+                name TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                fingerprint TEXT,
+                updated_at TEXT NOT NULL
+            )
+            """,
+        ]
+    ),
+    (
+        6,
+        "per-table change counters for conditional GET",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS table_versions (
+                table_name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+            """,
+        ]
+        + _change_counter_triggers("found_items")
+        + _change_counter_triggers("claims")
+    ),
+    (
+        7,
+        "shared token revocation store",
+        [
+            # id lets each worker pull only rows added since its last sync
+            """
+            CREATE TABLE IF NOT EXISTS revoked_tokens (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                jti TEXT NOT NULL UNIQUE,
+                expires_at INTEGER NOT NULL,
+                revoked_at TEXT NOT NULL
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires
+            ON revoked_tokens (expires_at)
+            """,
+        ]
+    ),
+    (
+        8,
+        "score-ordered admin review queue",
+        [
+            # WHERE status = 'pending' ORDER BY score DESC, created_at, id
+            """
+            CREATE INDEX IF NOT EXISTS idx_claims_status_score_created
+            ON claims (status, score DESC, created_at)
+            """,
+        ]
+    ),
+    (
+        9,
+        "indexes for audit history queries",
+        [
+            # Time-range scans across all entities, newest first
+            """
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp
+            ON audit_logs (timestamp)
+            """,
+            # Everything one user or admin did
+            """
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_performed_by
+            ON audit_logs (performed_by, timestamp)
+            """,
+        ]
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn) -> int:
+    """Return the applied schema version, or 0 for a fresh database."""
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] or 0
+
+
+def apply_migrations(conn) -> list[int]:
+    """
+    Bring the schema up to LATEST_VERSION.
+
+    Returns the list of versions applied (empty when already current).
+    The version is re-read under an IMMEDIATE lock so concurrent workers
+    starting together apply each migration exactly once.
+    """
+    if get_schema_version(conn) >= LATEST_VERSION:
+        return []
+
+    if conn.in_transaction:
+        conn.commit()
+
+    applied = []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TEXT NOT NULL
+            )
+        """)
+        current = get_schema_version(conn)
+
+        for version, description, statements in MIGRATIONS:
+            if version <= current:
+                continue
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(
+                "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                (version, description, datetime.now(timezone.utc).isoformat())
+            )
+            applied.append(version)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    return applied
@@ -0,0 +1,46 @@
+import time
+from datetime import datetime, timezone
+from typing import List, Tuple
+from .base import get_db_connection, get_read_connection
+from .writer import serialized_write
+from .validators import ValidationError, validate_int
+
+@serialized_write
+def revoke_token(jti: str, expires_at: int):
+    """Record a revoked token until its own expiry (epoch seconds). Re-revoking is a no-op."""
+    if not jti:
+        raise ValidationError("jti is required", 400)
+    expires_at = validate_int(expires_at, "expires_at")
+
+    with get_db_connection() as conn:
+        conn.execute(
+            "INSERT OR IGNORE INTO revoked_tokens (jti, expires_at, revoked_at) VALUES (?, ?, ?)",
+            (jti, expires_at, datetime.now(timezone.utc).isoformat())
+        )
+
+def is_token_revoked_in_db(jti: str) -> bool:
+    """Authoritative check: the token is revoked and has not expired yet."""
+    with get_read_connection() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM revoked_tokens WHERE jti = ? AND expires_at > ?",
+            (jti, int(time.time()))
+        ).fetchone()
+        return row is not None
+
+def get_revocations_since(after_id: int = 0) -> List[Tuple[int, str]]:
+    """Return (id, jti) of unexpired revocations added after after_id, oldest first."""
+    with get_read_connection() as conn:
+        rows = conn.execute(
+            "SELECT id, jti FROM revoked_tokens WHERE id > ? AND expires_at > ? ORDER BY id",
+            (after_id, int(time.time()))
+        ).fetchall()
+        return [(row["id"], row["jti"]) for row in rows]
+
+@serialized_write
+def purge_expired_revocations() -> int:
+    """Delete revocations whose tokens have expired anyway. Returns the number removed."""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "DELETE FROM revoked_tokens WHERE expires_at <= ?", (int(time.time()),)
+        )
+        return cursor.rowcount
@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+from backend.config.config import Config
+from .base import get_db_connection, get_read_connection
+from .writer import serialized_write
+from .cache import MemoryCache
+from .validators import validate_int
+
+USER_COLUMNS = "id, username, password_hash, role, created_at"
+
+# Per-process and never shared: records include password hashes, so they stay
+# out of the file cache. Writes invalidate locally; other workers see changes
+# within USER_CACHE_TTL.
+user_cache = MemoryCache(max_entries=Config.USER_CACHE_MAX_ENTRIES, ttl=Config.USER_CACHE_TTL)
+
+def _cache_user(user: Dict[str, Any]):
+    user_cache.set(f"user:id:{user['id']}", user)
+    user_cache.set(f"user:name:{user['username']}", user)
+
+def invalidate_user(user_id: int = None, username: str = None):
+    """Drop cached records for a user after it was written."""
+    if user_id is not None:
+        user_cache.delete(f"user:id:{user_id}")
+    if username is not None:
+        user_cache.delete(f"user:name:{username}")
+
+def _get_user(key: str, where: str, value) -> Optional[Dict[str, Any]]:
+    user = user_cache.get(key)
+    if user is None:
+        with get_read_connection() as conn:
+            row = conn.execute(f"SELECT {USER_COLUMNS} FROM users WHERE {where} = ?", (value,)).fetchone()
+        if row is None:
+            return None
+        user = dict(row)
+        _cache_user(user)
+    return dict(user)
+
+def get_user_by_username(username: str) -> Optional[Dict[str, Any]]:
+    """Return a user record by username (cached), or None."""
+    return _get_user(f"user:name:{username}", "username", username)
+
+def get_user_by_id(user_id: int) -> Optional[Dict[str, Any]]:
+    """Return a user record by id (cached), or None."""
+    user_id = validate_int(user_id, "user_id")
+    return _get_user(f"user:id:{user_id}", "id", user_id)
+
+@serialized_write
+def insert_user(username: str, password_hash: str, role: str = "user") -> int:
+    """Insert a user and return its id. Raises sqlite3.IntegrityError for a taken username."""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO users (username, password_hash, role, created_at) VALUES (?, ?, ?, ?)",
+            (username, password_hash, role, datetime.now(timezone.utc).isoformat())
+        )
+        user_id = cursor.lastrowid
+        conn.call_after_commit(lambda: invalidate_user(user_id, username))
+    return user_id
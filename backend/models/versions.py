@@ -0,0 +1,17 @@
+from typing import Dict
+from .base import get_read_connection
+
+def get_table_versions(*tables: str) -> Dict[str, int]:
+    """
+    Return the change counter of each table (see migration 6). Counters are
+    bumped by triggers on every insert, update and delete, so a value that
+    has not moved means the table's rows have not changed.
+    """
+    placeholders = ",".join("?" * len(tables))
+    with get_read_connection() as conn:
+        rows = conn.execute(
+            f"SELECT table_name, version FROM table_versions WHERE table_name IN ({placeholders})",
+            tables
+        ).fetchall()
+    versions = {row["table_name"]: row["version"] for row in rows}
+    return {table: versions.get(table, 0) for table in tables}
@@ -0,0 +1,169 @@
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from functools import wraps
+from backend.config.config import Config
+from .base import transaction, _pool
+
+logger = logging.getLogger(__name__)
+
+
+class _WriteUnit:
+    __slots__ = ("fn", "args", "kwargs", "result", "error", "done")
+
+    def __init__(self, fn, args, kwargs):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class WriteQueue:
+    """
+    Single writer per process (DB_WRITE_MODE = "queue").
+
+    One daemon thread owns the process's only read-write connection. It
+    takes whatever write units are queued (up to batch_size), runs each in
+    its own savepoint inside one BEGIN IMMEDIATE transaction, and commits
+    once for the whole batch (group commit). A failing unit only rolls back
+    its own savepoint. Callers block until the batch holding their unit
+    has committed, then get its return value or exception.
+    """
+
+    def __init__(self, batch_size: int, max_queue: int, timeout: float):
+        self.batch_size = batch_size
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+
+    def _ensure_started(self):
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            # Threads do not survive fork; a worker starts its own writer.
+            # A restarted writer in the same process keeps the queued units.
+            if self._queue is None or self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self.max_queue)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+            self._thread.start()
+
+    def is_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) on the writer thread and return its result.
+        Raises sqlite3.OperationalError if the queue stays full for timeout seconds.
+        """
+        self._ensure_started()
+        unit = _WriteUnit(fn, args, kwargs)
+        try:
+            self._queue.put(unit, timeout=self.timeout)
+        except queue.Full:
+            raise sqlite3.OperationalError("database write queue is full")
+        # Once queued the unit will run; wait for its batch rather than guess
+        unit.done.wait()
+        if unit.error is not None:
+            raise unit.error
+        return unit.result
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            except BaseException as e:
+                self._finish(batch, e)
+                raise
+
+    def _write_batch(self, batch):
+        # Writers in other processes can still hold the lock past busy_timeout;
+        # nothing has run before BEGIN IMMEDIATE succeeds, so just retry it.
+        deadline = time.monotonic() + self.timeout
+        delay = 0.01
+        while True:
+            try:
+                self._begin_and_run(batch)
+                return
+            except _LockNotAcquired as locked:
+                if time.monotonic() + delay > deadline:
+                    self._finish(batch, locked.error)
+                    return
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
+    def _begin_and_run(self, batch):
+        started = False
+        try:
+            with transaction() as conn:
+                started = True
+                for unit in batch:
+                    try:
+                        with conn.savepoint():
+                            unit.result = unit.fn(*unit.args, **unit.kwargs)
+                    except Exception as e:
+                        unit.error = e
+        except sqlite3.OperationalError as e:
+            if not started:
+                raise _LockNotAcquired(e)
+            self._finish(batch, e)
+        except Exception as e:
+            self._finish(batch, e)
+        else:
+            for unit in batch:
+                unit.done.set()
+
+    def _finish(self, batch, error):
+        """Fail every unit that had not failed on its own, then release the callers."""
+        logger.error("Write batch of %d units failed: %s", len(batch), error)
+        for unit in batch:
+            if unit.error is None:
+                unit.error = error
+            unit.done.set()
+
+
+class _LockNotAcquired(Exception):
+    def __init__(self, error):
+        self.error = error
+
+
+writer = WriteQueue(
+    batch_size=Config.DB_WRITE_BATCH_SIZE,
+    max_queue=Config.DB_WRITE_QUEUE_SIZE,
+    timeout=Config.DB_WRITE_TIMEOUT,
+)
+
+
+def serialized_write(fn):
+    """
+    Mark a model function as a write unit.
+
+    In "queue" mode the call is executed by the writer thread; otherwise,
+    on the writer thread itself, or when the caller already has a
+    transaction open (so it must stay part of it), fn runs inline.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if Config.DB_WRITE_MODE != "queue" or writer.is_writer_thread():
+            return fn(*args, **kwargs)
+        handle = _pool.peek()
+        if handle is not None and handle.depth > 0:
+            return fn(*args, **kwargs)
+        return writer.submit(fn, *args, **kwargs)
+    return wrapper
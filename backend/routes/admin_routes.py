@@ -1,8 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity, verify_jwt_in_request
 from functools import wraps
-from backend.services.admin_service import get_pending_claims_service, process_claim_verification
+from backend.services.admin_service import (
+    get_pending_claims_service,
+    stream_pending_claims_service,
+    process_claim_verification,
+    process_batch_claim_verification,
+)
+from backend.services.audit_service import get_audit_logs_service
 from backend.helpers.response import success_response, error_response
+from backend.helpers.streaming import wants_stream, ndjson_response
+from backend.helpers.conditional import conditional_get
+from backend.helpers.metrics import render_prometheus
 from backend.models import ValidationError
 
 admin_bp = Blueprint("admin", __name__)
@@ -28,10 +37,13 @@ def admin_required(fn):
 @admin_bp.route("/claims", methods=["GET"])
 @jwt_required()
 @admin_required
+@conditional_get("claims", "found_items")
 def view_claims():
     try:
-        claims, status = get_pending_claims_service()
-        return jsonify(success_response(claims)), status
+        if wants_stream(request):
+            return ndjson_response(stream_pending_claims_service(request.args))
+        page, status = get_pending_claims_service(request.args)
+        return jsonify(success_response(page)), status
     except ValidationError as ve:
         return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
 
@@ -50,3 +62,36 @@ def verify_claim_route(claim_id):
         return jsonify(success_response(result)), status
     except ValidationError as ve:
         return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
+
+
+@admin_bp.route("/claims/verify", methods=["POST"])
+@jwt_required()
+@admin_required
+def verify_claims_route():
+    data = request.json or {}
+    try:
+        identity = get_jwt_identity()
+        result, status = process_batch_claim_verification(data, identity["user_id"])
+        return jsonify(success_response(result)), status
+    except ValidationError as ve:
+        return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
+
+
+@admin_bp.route("/audit-logs", methods=["GET"])
+@jwt_required()
+@admin_required
+def view_audit_logs():
+    try:
+        page, status = get_audit_logs_service(request.args)
+        return jsonify(success_response(page)), status
+    except ValidationError as ve:
+        return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
+
+
+
+@admin_bp.route("/metrics", methods=["GET"])
+@jwt_required()
+@admin_required
+def metrics():
+    # This worker's metrics only; each process keeps its own
+    return Response(render_prometheus(), mimetype="text/plain; version=0.0.4")
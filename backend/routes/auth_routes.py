@@ -2,10 +2,17 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from backend.services.auth_service import register_user, login_user, refresh_token, logout_token
 from backend.helpers.response import success_response, error_response
+from backend.helpers.password_hashing import HashingBusyError
 from backend.models import ValidationError
 
 auth_bp = Blueprint("auth", __name__)
 
+def hashing_busy_response(busy: HashingBusyError):
+    """429 with Retry-After when the password hashing pool is saturated."""
+    response = jsonify(error_response("TOO_MANY_REQUESTS", busy.message))
+    response.headers["Retry-After"] = str(busy.retry_after)
+    return response, 429
+
 @auth_bp.route("/register", methods=["POST"])
 def register():
     data = request.get_json() or {}
@@ -14,6 +21,8 @@ def register():
         return jsonify(success_response(result)), status
     except ValidationError as ve:
         return jsonify(error_response("VALIDATION_ERROR", ve.message)), 400
+    except HashingBusyError as busy:
+        return hashing_busy_response(busy)
 
 @auth_bp.route("/login", methods=["POST"])
 def login():
@@ -23,6 +32,8 @@ def login():
         return jsonify(success_response(result)), status
     except ValidationError as ve:
         return jsonify(error_response("VALIDATION_ERROR", ve.message)), 401
+    except HashingBusyError as busy:
+        return hashing_busy_response(busy)
 
 @auth_bp.route("/refresh", methods=["POST"])
 @jwt_required(refresh=True)
@@ -39,8 +50,8 @@ def refresh():
 @jwt_required()
 def logout():
     try:
-        jti = get_jwt()["jti"]
-        result, status = logout_token(jti)
+        token = get_jwt()
+        result, status = logout_token(token["jti"], token["exp"])
         return jsonify(success_response(result)), status
     except ValidationError as ve:
         return jsonify(error_response("VALIDATION_ERROR", ve.message)), 400
\ No newline at end of file
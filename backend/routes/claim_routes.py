@@ -12,8 +12,7 @@ def submit_claim_route():
     data = request.json or {}
     try:
         identity = get_jwt_identity()
-        minimal_identity = {"user_id": identity["user_id"], "role": identity["role"]}
-        result, status = submit_claim(data, minimal_identity)
+        result, status = submit_claim(data, str(identity["user_id"]))
         return jsonify(success_response(result)), status
     except ValidationError as ve:
         return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
@@ -1,7 +1,17 @@
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required
-from backend.services.item_service import submit_found_item, submit_lost_item, get_found_items
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from backend.services.item_service import (
+    submit_found_item,
+    submit_lost_item,
+    get_found_items,
+    stream_found_items,
+    search_found_items_service,
+)
 from backend.helpers.response import error_response, success_response
+from backend.services.match_service import get_matches_for_lost_item
+from backend.services.import_service import import_found_items, import_format_from_request, import_stream_from_request
+from backend.helpers.streaming import wants_stream, ndjson_response
+from backend.helpers.conditional import conditional_get
 from backend.models import ValidationError, items
 
 item_bp = Blueprint("items", __name__)
@@ -17,9 +27,19 @@ def report_lost_item():
         return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
 
 
+@item_bp.route("/lost/<int:item_id>/matches", methods=["GET"])
+@jwt_required()
+def lost_item_matches(item_id):
+    try:
+        matches, status = get_matches_for_lost_item(item_id, request.args)
+        return jsonify(success_response(matches)), status
+    except ValidationError as ve:
+        return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
+
 
 @item_bp.route("/found", methods=["GET", "POST"])
 @jwt_required()
+@conditional_get("found_items")
 def found_items():
     if request.method == "POST":
         data = request.json or {}
@@ -29,5 +49,34 @@ def found_items():
         except ValidationError as ve:
             return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
         
-    items, status = get_found_items()
-    return jsonify(success_response(items)), status
+    try:
+        if wants_stream(request):
+            return ndjson_response(stream_found_items(request.args))
+        page, status = get_found_items(request.args)
+        return jsonify(success_response(page)), status
+    except ValidationError as ve:
+        return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
+
+
+@item_bp.route("/found/import", methods=["POST"])
+@jwt_required()
+def import_found_items_route():
+    try:
+        identity = get_jwt_identity()
+        fmt = import_format_from_request(request)
+        result, status = import_found_items(
+            import_stream_from_request(request), fmt, str(identity["user_id"])
+        )
+        return jsonify(success_response(result)), status
+    except ValidationError as ve:
+        return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
+
+
+@item_bp.route("/found/search", methods=["GET"])
+@jwt_required()
+def search_found_items_route():
+    try:
+        page, status = search_found_items_service(request.args)
+        return jsonify(success_response(page)), status
+    except ValidationError as ve:
+        return jsonify(error_response("VALIDATION_ERROR", ve.message)), ve.status_code
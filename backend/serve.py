@@ -0,0 +1,75 @@
+"""
+Production server.
+
+Runs the bootstrap (migrations, default admin) once, then serves the app
+with gunicorn on POSIX - preloaded, so workers fork from a master that
+already imported and built the app - or with waitress on Windows.
+
+Usage:
+    python -m backend.serve
+    gunicorn -c python:backend.serve backend.app:app   # same settings via the gunicorn CLI
+
+With the gunicorn CLI the bootstrap runs inside create_app() while the
+master preloads backend.app, so it still happens once, before any worker
+forks.
+
+Settings come from Config (SERVER_HOST, SERVER_PORT, SERVER_WORKERS,
+SERVER_THREADS, SERVER_TIMEOUT).
+"""
+import os
+import sys
+
+from backend.config.config import Config
+
+# gunicorn settings; also read by `gunicorn -c python:backend.serve`
+bind = f"{Config.SERVER_HOST}:{Config.SERVER_PORT}"
+workers = Config.SERVER_WORKERS
+threads = Config.SERVER_THREADS
+timeout = Config.SERVER_TIMEOUT
+preload_app = True
+worker_class = "gthread"
+
+
+def run_gunicorn():
+    from gunicorn.app.base import BaseApplication
+    from backend import create_app
+
+    class Server(BaseApplication):
+        def load_config(self):
+            settings = {
+                "bind": bind,
+                "workers": workers,
+                "threads": threads,
+                "timeout": timeout,
+                "preload_app": preload_app,
+                "worker_class": worker_class,
+            }
+            for key, value in settings.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return create_app(bootstrap=False)
+
+    Server().run()
+
+
+def run_waitress():
+    from waitress import serve
+    from backend import create_app
+
+    serve(create_app(bootstrap=False), host=Config.SERVER_HOST, port=Config.SERVER_PORT, threads=Config.SERVER_THREADS)
+
+
+def main():
+    from backend.bootstrap import bootstrap
+    bootstrap()
+
+    if os.name == "nt":
+        run_waitress()
+    else:
+        run_gunicorn()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
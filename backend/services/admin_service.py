@@ -1,16 +1,61 @@
 from backend.helpers.claim_helpers import get_claim_by_id 
 from backend.models import (
-    get_pending_claims,
+    iter_pending_claims,
+    get_claim_review_queue,
+    validate_int,
     verify_claim,
+    verify_claims,
     require_fields,
     validate_claim_decision,
     ValidationError
 )
+from backend.models.claims import CLAIM_QUEUE_FILTERS, CLAIM_QUEUE_SORTS
+from backend.helpers.pagination import parse_limit, decode_cursor, build_page
 
-def get_pending_claims_service():
-    """Return pending claims"""
-    claims = get_pending_claims()
-    return claims, 200
+def get_pending_claims_service(params: dict = None):
+    """
+    Returns one page of the pending claim review queue.
+
+    Args:
+        params (dict): Query args - sort ("score" (default) or "created"),
+            limit, cursor and any of category, found_item_id, min_score
+
+    Returns:
+        tuple: ({"items": [...], "next_cursor": str | None}, HTTP status)
+    """
+    params = params or {}
+    sort = _parse_claim_queue_sort(params)
+    limit = parse_limit(params.get("limit"))
+    after = decode_cursor(params.get("cursor"), CLAIM_QUEUE_SORTS[sort][1])
+    filters = _parse_claim_queue_filters(params)
+
+    rows = get_claim_review_queue(filters=filters, sort=sort, after=after, limit=limit + 1)
+    if sort == "score":
+        key = lambda row: (row["score"], row["created_at"], row["claim_id"])
+    else:
+        key = lambda row: (row["created_at"], row["claim_id"])
+    return build_page(rows, limit, key=key), 200
+
+def stream_pending_claims_service(params: dict = None):
+    """Return an iterator over every matching pending claim for streaming responses"""
+    params = params or {}
+    return iter_pending_claims(
+        filters=_parse_claim_queue_filters(params),
+        sort=_parse_claim_queue_sort(params, default="created"),
+    )
+
+def _parse_claim_queue_sort(params: dict, default: str = "score") -> str:
+    sort = params.get("sort") or default
+    if sort not in CLAIM_QUEUE_SORTS:
+        raise ValidationError(f"sort must be one of: {', '.join(CLAIM_QUEUE_SORTS)}", 400)
+    return sort
+
+def _parse_claim_queue_filters(params: dict) -> dict:
+    filters = {key: params.get(key) for key in CLAIM_QUEUE_FILTERS if params.get(key)}
+    for key in ("found_item_id", "min_score"):
+        if key in filters:
+            filters[key] = validate_int(filters[key], key)
+    return filters
 
 def process_claim_verification(claim_id: int, data: dict, admin_username: str):
     """Validate and verify claim with edge-case handling"""
@@ -32,4 +77,19 @@ def process_claim_verification(claim_id: int, data: dict, admin_username: str):
         decision=data["decision"],
         admin_username=admin_username
     )
-    return result, status
\ No newline at end of file
+    return result, status
+
+def process_batch_claim_verification(data: dict, admin_username: str):
+    """Approve or reject a list of claims at once; returns per-id outcomes"""
+    require_fields(data, ["claim_ids", "decision"])
+    validate_claim_decision(data["decision"])
+
+    result, status = verify_claims(
+        claim_ids=data["claim_ids"],
+        decision=data["decision"],
+        admin_username=admin_username
+    )
+    if status != 200:
+        raise ValidationError(result["error"], status)
+    return result, status
+
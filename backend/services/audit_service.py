@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from backend.models import get_audit_logs, iter_archived_audit_logs, validate_int, ValidationError
+from backend.models.audit import AUDIT_LOG_FILTERS
+from backend.helpers.pagination import parse_limit, decode_cursor, build_page
+
+
+def get_audit_logs_service(params: dict = None) -> tuple:
+    """
+    Returns one page of audit history, newest first.
+
+    Args:
+        params (dict): Query args - limit, cursor, archived ("1" to include
+            rows moved to archive segments) and any of entity_type,
+            entity_id, performed_by, action, since, until (ISO 8601; naive
+            times are taken as UTC)
+
+    Returns:
+        tuple: ({"items": [...], "next_cursor": str | None}, HTTP status)
+    """
+    params = params or {}
+    limit = parse_limit(params.get("limit"))
+    after = decode_cursor(params.get("cursor"), 2)
+    filters = _parse_audit_log_filters(params)
+
+    rows = get_audit_logs(filters=filters, after=after, limit=limit + 1)
+    if params.get("archived") in ("1", "true"):
+        archived = get_archived_audit_logs(filters=filters, after=after, limit=limit + 1)
+        rows = sorted(rows + archived, key=lambda row: (row["timestamp"], row["id"]), reverse=True)[:limit + 1]
+    page = build_page(rows, limit, key=lambda row: (row["timestamp"], row["id"]))
+    return page, 200
+
+
+def get_archived_audit_logs(filters: dict, after: tuple = None, limit: int = None) -> list:
+    """
+    Archived counterpart of models.get_audit_logs: same filters, order and
+    keyset. Reads day segments newest first and stops as soon as limit rows
+    are found, since older segments can only hold older rows. Segments that
+    start after the cursor's timestamp are skipped without being read.
+    """
+    until = filters.get("until")
+    if after is not None:
+        # Smallest string above the cursor timestamp: rows at that exact
+        # timestamp (with a lower id) are still on the cursor's side
+        cursor_until = f"{after[0]}\0"
+        until = min(until, cursor_until) if until else cursor_until
+
+    matches = []
+    for day_rows in iter_archived_audit_logs(since=filters.get("since"), until=until):
+        matches.extend(
+            row for row in day_rows
+            if _archived_row_matches(row, filters)
+            and (after is None or (row["timestamp"], row["id"]) < tuple(after))
+        )
+        if limit is not None and len(matches) >= limit:
+            return matches[:limit]
+    return matches
+
+
+def _archived_row_matches(row: dict, filters: dict) -> bool:
+    for key in ("entity_type", "entity_id", "performed_by", "action"):
+        if key in filters and row[key] != filters[key]:
+            return False
+    if "since" in filters and row["timestamp"] < filters["since"]:
+        return False
+    if "until" in filters and row["timestamp"] >= filters["until"]:
+        return False
+    return True
+
+
+def _parse_audit_log_filters(params: dict) -> dict:
+    filters = {key: params.get(key) for key in AUDIT_LOG_FILTERS if params.get(key)}
+    if "entity_id" in filters:
+        filters["entity_id"] = validate_int(filters["entity_id"], "entity_id")
+    for key in ("since", "until"):
+        if key in filters:
+            filters[key] = _utc_isoformat(filters[key], key)
+    return filters
+
+
+def _utc_isoformat(value: str, field_name: str) -> str:
+    """Normalize a timestamp to the UTC isoformat audit rows are stored in."""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f"Invalid datetime format for {field_name}", 400)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
@@ -1,10 +1,8 @@
 from backend.helpers.user_helpers import create_user, get_user, verify_password
-from backend.models import ValidationError
+from backend.models import ValidationError, get_user_by_id
 from flask_jwt_extended import create_access_token
 from backend.helpers.validate_register import validate_registration_data
-
-# Simple in-memory revoked tokens store
-revoked_tokens = set()
+from backend.services.revocation_service import revocation_store
 
 def register_user(data: dict):
     """Handles user registration"""
@@ -47,17 +45,27 @@ def login_user(data: dict):
     return {"token": token, "message": "Login successful"}, 200
 
 def refresh_token(identity):
-    """Generate a new access token"""
-    # identity already minimal if coming from get_jwt_identity()
-    new_access_token = create_access_token(identity=identity)
+    """Generate a new access token, re-reading the role from the (cached) user record"""
+    user = get_user_by_id(identity["user_id"])
+    if user is None:
+        raise ValidationError("User no longer exists.")
+    new_access_token = create_access_token(
+        identity={"user_id": user["id"], "role": user["role"]}
+    )
     return {"token": new_access_token, "message": "Access token refreshed"}, 200
 
-def logout_token(jti: str):
-    """Revoke a JWT"""
+def logout_token(jti: str, expires_at: int):
+    """Revoke a JWT until it would have expired anyway"""
     if not jti:
         raise ValidationError("No token provided to revoke.")
-    revoked_tokens.add(jti)
+    revocation_store.revoke(jti, expires_at)
     return {"message": "Logout successful, token revoked"}, 200
 
 def is_token_revoked(jti: str) -> bool:
-    return jti in revoked_tokens
\ No newline at end of file
+    return revocation_store.is_revoked(jti)
+
+def register_token_blocklist(jwt):
+    """Reject revoked tokens on every @jwt_required route."""
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload):
+        return is_token_revoked(jwt_payload["jti"])
@@ -0,0 +1,227 @@
+"""
+Vectorized scoring of N claims against M found items.
+
+Each field is encoded once per side: values are normalized and
+dictionary-encoded to integer ids (0 = empty). A tolerance is evaluated
+once per (distinct claim value, distinct found value) pair into a
+(U_claim + 1, U_found + 1) table, which is broadcast through the id arrays.
+Totals are a weighted sum of the per-field match matrices.
+
+exact, contains and fuzzy build their tables with array operations
+(string comparison, substring search over whole rows, and a trigram
+inverted index). Other tolerances fall back to calling the field's matcher
+on every distinct pair, which is only fast for low-cardinality fields.
+"""
+from backend.services.claim_scoring import (
+    ScoringPlan,
+    normalize,
+    synonym_lookup,
+    trigrams,
+    compile_scoring_plan,
+    get_scoring_plan,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Upper bound on the cells of one intermediate (rows x U_found) array
+CHUNK_CELLS = 1 << 20
+
+# tolerance name -> builder(rule, claim_values, found_values) returning the
+# (len(claim_values), len(found_values)) bool table; values are numpy str arrays
+BATCH_TOLERANCES = {}
+
+def register_batch_tolerance(name: str):
+    """Register an array implementation of tolerance `name` for batch scoring."""
+    def decorator(builder):
+        BATCH_TOLERANCES[name] = builder
+        return builder
+    return decorator
+
+
+def _encode(values):
+    """Normalize values; return (distinct values as a str array, ids into it + 1, 0 = empty)."""
+    vocabulary = {}
+    ids = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        value = normalize(value)
+        ids[i] = vocabulary.setdefault(value, len(vocabulary) + 1) if value else 0
+    return np.array(list(vocabulary), dtype=str), ids
+
+
+def _row_chunks(rows: int, columns: int):
+    step = max(1, CHUNK_CELLS // max(columns, 1))
+    for start in range(0, rows, step):
+        yield slice(start, min(start + step, rows))
+
+
+def _contains_table(a, b):
+    strings = getattr(np, "strings", np.char)
+    table = np.zeros((len(a), len(b)), dtype=bool)
+    for rows in _row_chunks(len(a), len(b)):
+        x, y = a[rows, None], b[None, :]
+        table[rows] = (strings.find(y, x) >= 0) | (strings.find(x, y) >= 0)
+    return table
+
+
+def _trigram_table(a, b, threshold: float):
+    """table[i, j] = trigram_similarity(a[i], b[j]) >= threshold, via an inverted index on b."""
+    found_grams = [trigrams(value) for value in b]
+    found_sizes = np.array([len(grams) for grams in found_grams], dtype=np.float64)
+    postings = {}
+    for j, grams in enumerate(found_grams):
+        for gram in grams:
+            postings.setdefault(gram, []).append(j)
+    postings = {gram: np.array(js, dtype=np.intp) for gram, js in postings.items()}
+
+    table = np.zeros((len(a), len(b)), dtype=bool)
+    for i, value in enumerate(a):
+        grams = trigrams(value)
+        if not grams:
+            table[i] = 0.0 >= threshold
+            continue
+        shared = np.zeros(len(b), dtype=np.float64)
+        for gram in grams:
+            js = postings.get(gram)
+            if js is not None:
+                shared[js] += 1
+        # Same division as trigram_similarity; a side without trigrams scores 0.0
+        union = len(grams) + found_sizes - shared
+        similarity = np.where(found_sizes > 0, shared / union, 0.0)
+        table[i] = similarity >= threshold
+    return table
+
+
+@register_batch_tolerance("exact")
+def _exact_table(rule, a, b):
+    return a[:, None] == b[None, :]
+
+
+@register_batch_tolerance("contains")
+def _contains_batch(rule, a, b):
+    return _contains_table(a, b)
+
+
+@register_batch_tolerance("fuzzy")
+def _fuzzy_table(rule, a, b):
+    table = _contains_table(a, b)
+    if rule.get("synonyms"):
+        synonyms = synonym_lookup(rule["synonyms"])
+        ca = np.array([synonyms.get(value, value) for value in a.tolist()])
+        cb = np.array([synonyms.get(value, value) for value in b.tolist()])
+        table |= ca[:, None] == cb[None, :]
+    return table | _trigram_table(a, b, rule.get("threshold", 0.4))
+
+
+def _pair_table(a, b, matcher):
+    """Fallback: call matcher once per distinct (claim value, found value) pair."""
+    table = np.zeros((len(a), len(b)), dtype=bool)
+    found_values = b.tolist()
+    for i, x in enumerate(a.tolist()):
+        table[i] = [matcher(x, y) for y in found_values]
+    return table
+
+
+def _match_matrix(f, claims: list, found_items: list):
+    """(N, M) bool matrix of field f over every claim / found item pair."""
+    claim_values, claim_ids = _encode([claim.get(f.claim_key) for claim in claims])
+    found_values, found_ids = _encode([item.get(f.found_key) for item in found_items])
+
+    # Row and column 0 stand for an empty value and never match
+    table = np.zeros((len(claim_values) + 1, len(found_values) + 1), dtype=bool)
+    if len(claim_values) and len(found_values):
+        builder = BATCH_TOLERANCES.get(f.tolerance)
+        if builder is not None:
+            table[1:, 1:] = builder(f.rule, claim_values, found_values)
+        else:
+            table[1:, 1:] = _pair_table(claim_values, found_values, f.matcher)
+    return table[np.ix_(claim_ids, found_ids)]
+
+
+def _bitmap_dtype(n_fields: int):
+    """Smallest unsigned integer type with one bit per field."""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if n_fields <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"Batch scoring supports at most 64 fields, plan has {n_fields}")
+
+
+def _resolve_plan(rules) -> ScoringPlan:
+    if isinstance(rules, ScoringPlan):
+        return rules
+    return compile_scoring_plan(rules) if rules else get_scoring_plan()
+
+
+def score_claims_batch(claims: list, found_items: list, rules=None) -> dict:
+    """
+    Score every claim against every found item.
+
+    Parameters:
+        claims (list[dict]): Claim dicts with claimed_* keys.
+        found_items (list[dict]): found_items rows.
+        rules (dict | ScoringPlan): Rules or a compiled plan; defaults to SCORING_RULES.
+
+    Returns:
+        dict:
+            fields  - field names, in bit order
+            weights - int array of per-field weights
+            totals  - (N, M) int array of total scores
+            matches - {field: (N, M) bool array}
+            bitmap  - (N, M) unsigned int array, bit i set when fields[i] matched;
+                      the dtype is the smallest that holds one bit per field
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for batch claim scoring")
+
+    plan = _resolve_plan(rules)
+    n, m = len(claims), len(found_items)
+    weights = np.array(plan.weights, dtype=np.int32)
+
+    totals = np.zeros((n, m), dtype=np.int32)
+    bitmap_dtype = _bitmap_dtype(len(plan.fields))
+    bitmap = np.zeros((n, m), dtype=bitmap_dtype)
+    matches = {}
+
+    for bit, f in enumerate(plan.fields):
+        matched = _match_matrix(f, claims, found_items)
+        matches[f.field] = matched
+        totals += matched * weights[bit]
+        bitmap |= matched.astype(bitmap_dtype) << bitmap_dtype(bit)
+
+    return {
+        "fields": [f.field for f in plan.fields],
+        "weights": weights,
+        "totals": totals,
+        "matches": matches,
+        "bitmap": bitmap
+    }
+
+
+def best_matches(claims: list, found_items: list, top_k: int = 1, rules=None) -> list:
+    """
+    For each claim, return the top_k found items by batch score.
+
+    Returns:
+        list: One list per claim of {"found_item_id", "score", "matched"}, best first.
+    """
+    result = score_claims_batch(claims, found_items, rules)
+    totals, bitmap, fields = result["totals"], result["bitmap"], result["fields"]
+    if not found_items:
+        return [[] for _ in claims]
+
+    top_k = min(top_k, len(found_items))
+    order = np.argsort(-totals, axis=1, kind="stable")[:, :top_k]
+
+    ranked = []
+    for i, row in enumerate(order):
+        ranked.append([
+            {
+                "found_item_id": found_items[j]["id"],
+                "score": int(totals[i, j]),
+                "matched": [field for bit, field in enumerate(fields) if bitmap[i, j] >> bit & 1]
+            }
+            for j in row
+        ])
+    return ranked
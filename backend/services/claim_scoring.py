@@ -1,59 +1,204 @@
-from backend.config.claim_scoring import SCORING_RULES
+import re
+from functools import lru_cache
+from typing import Callable, NamedTuple
+from backend.config.claim_scoring import SCORING_RULES, SYNONYM_TABLES
 
 def normalize(value):
-    return value.strip().lower() if value else ""
+    return str(value).strip().lower() if value else ""
 
 def matches(a, b):
     return normalize(a) == normalize(b)
 
-def match_with_tolerance(claim_value, found_value, tolerance):
+# --- Tolerance registry ---
+# name -> factory(rule) returning matcher(a, b) over normalized, non-empty strings
+TOLERANCES: dict[str, Callable[[dict], Callable[[str, str], bool]]] = {}
+
+def register_tolerance(name: str):
+    """Register a tolerance factory under `name` for use in SCORING_RULES."""
+    def decorator(factory):
+        TOLERANCES[name] = factory
+        return factory
+    return decorator
+
+def _tokens(value: str) -> set:
+    return set(re.findall(r"\w+", value))
+
+def _number(value: str):
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+@register_tolerance("exact")
+def _exact(rule):
+    return lambda x, y: x == y
+
+@register_tolerance("contains")
+def _contains(rule):
+    return lambda x, y: x in y or y in x
+
+@register_tolerance("prefix")
+def _prefix(rule):
+    return lambda x, y: x.startswith(y) or y.startswith(x)
+
+@register_tolerance("token_set")
+def _token_set(rule):
+    """Word-order-insensitive match: Jaccard overlap of word sets >= rule["threshold"] (default 0.5)."""
+    threshold = rule.get("threshold", 0.5)
+
+    def matcher(x, y):
+        a, b = _tokens(x), _tokens(y)
+        if not a or not b:
+            return False
+        return len(a & b) / len(a | b) >= threshold
+    return matcher
+
+@register_tolerance("numeric_range")
+def _numeric_range(rule):
+    """Both values parse as numbers and differ by at most rule["range"] (default 0)."""
+    allowed = rule.get("range", 0)
+
+    def matcher(x, y):
+        a, b = _number(x), _number(y)
+        return a is not None and b is not None and abs(a - b) <= allowed
+    return matcher
+
+@lru_cache(maxsize=8192)
+def trigrams(value: str) -> frozenset:
+    """pg_trgm-style trigrams: each word padded with two leading spaces and one trailing."""
+    grams = set()
+    for word in re.findall(r"\w+", value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the trigram sets of a and b (0.0 - 1.0)."""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+def synonym_lookup(table_name: str) -> dict:
+    """Flatten a synonym table into spelling -> canonical value."""
+    lookup = {}
+    for canonical, spellings in SYNONYM_TABLES.get(table_name, {}).items():
+        lookup[canonical] = canonical
+        for spelling in spellings:
+            lookup[spelling] = canonical
+    return lookup
+
+@register_tolerance("fuzzy")
+def _fuzzy(rule):
+    """
+    Tolerant free-text match: contains, a shared synonym (rule["synonyms"]),
+    or trigram similarity >= rule["threshold"] (default 0.4).
+    """
+    threshold = rule.get("threshold", 0.4)
+    synonyms = synonym_lookup(rule["synonyms"]) if rule.get("synonyms") else {}
+
+    def matcher(x, y):
+        if x in y or y in x:
+            return True
+        if synonyms and synonyms.get(x, x) == synonyms.get(y, y):
+            return True
+        return trigram_similarity(x, y) >= threshold
+    return matcher
+
+def get_matcher(tolerance: str, rule: dict = None):
+    """Build the matcher for a tolerance name. Raises KeyError for unknown tolerances."""
+    return TOLERANCES[tolerance](rule or {})
+
+def match_with_tolerance(claim_value, found_value, tolerance, rule=None):
     a = normalize(claim_value)
     b = normalize(found_value)
 
     if not a or not b:
         return False
 
-    matchers = {
-        "exact": lambda x, y: x == y,
-        "contains": lambda x, y: x in y or y in x
-    }
+    return get_matcher(tolerance, rule)(a, b)
+
+# Scoring field -> (claim key, found item key)
+FIELD_MAP = {
+    "category": ("claimed_category", "category"),
+    "item_type": ("claimed_item_type", "item_type"),
+    "brand": ("claimed_brand", "brand"),
+    "color": ("claimed_color", "color"),
+    "location": ("claimed_location", "found_location"),
+    "private_details": ("claimed_private_details", "public_description"),
+}
+
+# --- Compiled scoring plans ---
+class PlanField(NamedTuple):
+    field: str
+    claim_key: str
+    found_key: str
+    weight: int
+    tolerance: str
+    matcher: Callable[[str, str], bool]
+    rule: dict
+
+class ScoringPlan(NamedTuple):
+    """Immutable, pre-resolved form of a rules dict."""
+    fields: tuple
+    weights: tuple
+    max_score: int
+
+def compile_scoring_plan(rules: dict = None) -> ScoringPlan:
+    """Resolve field keys, weights and matcher callables once for a rules dict."""
+    rules = rules or SCORING_RULES
+    fields = tuple(
+        PlanField(
+            field,
+            claim_key,
+            found_key,
+            rules[field]["weight"],
+            rules[field]["tolerance"],
+            get_matcher(rules[field]["tolerance"], rules[field]),
+            rules[field]
+        )
+        for field, (claim_key, found_key) in FIELD_MAP.items()
+    )
+    weights = tuple(f.weight for f in fields)
+    return ScoringPlan(fields, weights, sum(weights))
+
+_default_plan = None
 
-    return matchers[tolerance](a, b)
+def get_scoring_plan() -> ScoringPlan:
+    """Plan for SCORING_RULES, compiled on first use."""
+    global _default_plan
+    if _default_plan is None:
+        _default_plan = compile_scoring_plan(SCORING_RULES)
+    return _default_plan
 
-def compute_claim_score(claim_data, found_item):
+def reload_scoring_plan() -> ScoringPlan:
+    """Recompile the default plan after SCORING_RULES changed at runtime."""
+    global _default_plan
+    _default_plan = None
+    return get_scoring_plan()
+
+def compute_claim_score(claim_data, found_item, plan: ScoringPlan = None):
+    plan = plan or get_scoring_plan()
     total_score = 0
     matched_fields = []
     breakdown = []
 
-    field_map = {
-        "category": ("claimed_category", "category"),
-        "item_type": ("claimed_item_type", "item_type"),
-        "brand": ("claimed_brand", "brand"),
-        "color": ("claimed_color", "color"),
-        "location": ("claimed_location", "found_location"),
-        "private_details": ("claimed_private_details", "public_description"),
-    }
-
-    for field, (claim_key, found_key) in field_map.items():
-        rule = SCORING_RULES[field]
-
-        matched = match_with_tolerance(
-            claim_data.get(claim_key),
-            found_item.get(found_key),
-            rule["tolerance"]
-        )
+    for f in plan.fields:
+        a = normalize(claim_data.get(f.claim_key))
+        b = normalize(found_item.get(f.found_key))
+        matched = bool(a and b and f.matcher(a, b))
 
-        earned = rule["weight"] if matched else 0
+        earned = f.weight if matched else 0
         total_score += earned
 
         if matched:
-            matched_fields.append(field)
+            matched_fields.append(f.field)
 
         breakdown.append({
-            "field": field,
+            "field": f.field,
             "matched": matched,
             "score": earned,
-            "max_score": rule["weight"]
+            "max_score": f.weight
         })
 
     return {
@@ -0,0 +1,171 @@
+import csv
+import io
+import json
+import sqlite3
+from datetime import datetime
+from backend.config.config import Config
+from backend.models import (
+    bulk_create_found_items,
+    ValidationError,
+    require_fields,
+)
+
+IMPORT_FORMATS = {"csv", "ndjson"}
+
+FOUND_ITEM_IMPORT_FIELDS = (
+    "category",
+    "item_type",
+    "color",
+    "brand",
+    "found_location",
+    "found_datetime",
+    "public_description",
+)
+
+# Values a column can hold; nested JSON objects and arrays are row errors
+SCALAR_TYPES = (str, int, float)
+
+
+def iter_import_records(stream, fmt: str):
+    """
+    Parse a text stream row by row.
+
+    Yields:
+        tuple: (line number, record dict or None, error message or None)
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise ValidationError(f"Unsupported import format: {fmt}", 400)
+
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record, None
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, None, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def validate_found_item_record(record: dict) -> dict:
+    """Validate one import row and return only the known found item fields."""
+    require_fields(record, ["category", "found_location", "found_datetime"])
+    for key in FOUND_ITEM_IMPORT_FIELDS:
+        value = record.get(key)
+        if value is not None and not isinstance(value, SCALAR_TYPES):
+            raise ValidationError(f"{key} must be a string or number", 400)
+    try:
+        datetime.fromisoformat(str(record["found_datetime"]))
+    except ValueError:
+        raise ValidationError("Invalid datetime format for found_datetime", 400)
+
+    return {
+        key: (record.get(key) or None)
+        for key in FOUND_ITEM_IMPORT_FIELDS
+    }
+
+
+def import_found_items(stream, fmt: str, reported_by: str, chunk_size: int = None) -> tuple:
+    """
+    Validates and bulk inserts found items from a CSV or NDJSON text stream.
+
+    Rows are validated as they are read and inserted in chunks of chunk_size,
+    one transaction per chunk, so memory stays bounded by the chunk size.
+    Invalid rows are reported by line; a chunk the database rejects is
+    reported by its first and last line and the import carries on. Bytes
+    that are not valid UTF-8 end the import with an error on the first line
+    that could not be read.
+
+    Args:
+        stream: Text stream (file object, request body wrapper, ...)
+        fmt (str): "csv" or "ndjson"
+        reported_by (str): Identity recorded in the audit log
+
+    Returns:
+        tuple: ({"inserted", "failed", "item_ids", "errors"}, HTTP status)
+    """
+    chunk_size = chunk_size or Config.IMPORT_CHUNK_SIZE
+    inserted_ids, errors, chunk, chunk_lines = [], [], [], []
+    failed = 0
+
+    def flush():
+        # A chunk the database rejects fails as a whole; later chunks still run
+        nonlocal failed
+        try:
+            inserted_ids.extend(bulk_create_found_items(chunk, reported_by))
+        except sqlite3.Error as e:
+            failed += len(chunk)
+            errors.append({
+                "lines": [chunk_lines[0], chunk_lines[-1]],
+                "error": f"Chunk rejected by the database: {e}"
+            })
+        chunk.clear()
+        chunk_lines.clear()
+
+    line_number = 0
+    try:
+        for line_number, record, error in iter_import_records(stream, fmt):
+            if error is None:
+                try:
+                    chunk.append(validate_found_item_record(record))
+                    chunk_lines.append(line_number)
+                except ValidationError as ve:
+                    error = ve.message
+            if error is not None:
+                failed += 1
+                errors.append({"line": line_number, "error": error})
+
+            if len(chunk) >= chunk_size:
+                flush()
+    except UnicodeDecodeError:
+        # Nothing past undecodable bytes can be read; keep the rows before them
+        failed += 1
+        errors.append({"line": line_number + 1, "error": "Upload is not valid UTF-8"})
+
+    if chunk:
+        flush()
+
+    summary = {
+        "inserted": len(inserted_ids),
+        "failed": failed,
+        "item_ids": inserted_ids,
+        "errors": errors
+    }
+    return summary, (201 if inserted_ids else 400)
+
+
+def import_format_from_request(request) -> str:
+    """Pick the import format from ?format=, the upload filename or the Content-Type."""
+    fmt = request.args.get("format")
+    if fmt:
+        return fmt.lower()
+
+    upload = request.files.get("file")
+    filename = (upload.filename or "") if upload else ""
+    if filename.endswith(".csv"):
+        return "csv"
+    if filename.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+
+    if request.mimetype == "text/csv":
+        return "csv"
+    if request.mimetype in ("application/x-ndjson", "application/jsonl"):
+        return "ndjson"
+
+    raise ValidationError("Cannot determine import format; pass ?format=csv or ?format=ndjson", 400)
+
+
+def import_stream_from_request(request):
+    """Wrap the uploaded file (or raw body) as a text stream without buffering it all."""
+    upload = request.files.get("file")
+    raw = upload.stream if upload else request.stream
+    return io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
@@ -2,10 +2,14 @@ from backend.models import (
     create_lost_item,
     create_found_item,
     get_published_found_items,
+    iter_published_found_items,
+    search_found_items,
     ValidationError,
     require_fields,
 )
-from datetime import datetime
+from backend.models.items import FOUND_ITEM_FILTERS
+from backend.helpers.pagination import parse_limit, decode_cursor, build_page
+from datetime import datetime, timezone
 
 def submit_lost_item(data: dict) -> tuple:
     """
@@ -55,11 +59,73 @@ def submit_found_item(data: dict) -> tuple:
     return {"message": "Found item reported successfully"}, 201
 
 
-def get_found_items() -> tuple:
+def get_found_items(params: dict = None) -> tuple:
     """
-    Returns published found items. No validation needed.
-    
+    Returns one page of published found items.
+
+    Args:
+        params (dict): Query args - limit, cursor and any of
+            category, item_type, color, found_after, found_before
+
     Returns:
-        tuple: (list of items, HTTP status)
+        tuple: ({"items": [...], "next_cursor": str | None}, HTTP status)
+    """
+    params = params or {}
+    limit = parse_limit(params.get("limit"))
+    after = decode_cursor(params.get("cursor"), 2)
+    filters = _parse_found_item_filters(params)
+
+    rows = get_published_found_items(filters=filters, after=after, limit=limit + 1)
+    page = build_page(rows, limit, key=lambda row: (row["created_at"], row["id"]))
+    return page, 200
+
+
+def stream_found_items(params: dict = None):
+    """
+    Returns an iterator over every published found item matching the filters.
+    Pagination args are ignored; rows are read from the cursor in batches.
     """
-    return get_published_found_items(), 200
+    filters = _parse_found_item_filters(params or {})
+    return iter_published_found_items(filters=filters)
+
+
+def _parse_found_item_filters(params: dict) -> dict:
+    filters = {key: params.get(key) for key in FOUND_ITEM_FILTERS if params.get(key)}
+    for key in ("found_after", "found_before"):
+        if key in filters:
+            filters[key] = _utc_isoformat(filters[key], key)
+    return filters
+
+
+def _utc_isoformat(value: str, field_name: str) -> str:
+    """Normalize a filter timestamp to UTC isoformat so it compares correctly as text."""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f"Invalid datetime format for {field_name}", 400)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
+
+
+def search_found_items_service(params: dict = None) -> tuple:
+    """
+    Full-text search over published found items.
+
+    Args:
+        params (dict): Query args - q (required), limit, cursor
+
+    Returns:
+        tuple: ({"items": [...], "next_cursor": str | None}, HTTP status)
+    """
+    params = params or {}
+    text = (params.get("q") or "").strip()
+    if not text:
+        raise ValidationError("Query parameter 'q' is required", 400)
+
+    limit = parse_limit(params.get("limit"), default=20)
+    after = decode_cursor(params.get("cursor"), 2)
+
+    rows = search_found_items(text, after=after, limit=limit + 1)
+    page = build_page(rows, limit, key=lambda row: (row["rank"], row["id"]))
+    return page, 200
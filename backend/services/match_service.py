@@ -0,0 +1,117 @@
+from backend.config.config import Config
+from backend.config.claim_scoring import SYNONYM_TABLES
+from backend.models import (
+    get_lost_item_by_id,
+    find_found_item_candidates,
+    find_similar_found_items,
+    validate_int,
+    ValidationError,
+)
+from backend.services.claim_scoring import compute_claim_score, normalize, synonym_lookup
+
+# Found item columns searched in the inverted index
+INDEXED_FIELDS = ("category", "item_type", "brand", "color")
+
+# Lost item field -> found item column searched in the trigram index
+FUZZY_FIELDS = {
+    "brand": "brand",
+    "color": "color",
+    "last_seen_location": "found_location",
+}
+
+
+def expand_synonyms(value, table_name: str) -> list:
+    """Return value plus every spelling sharing its canonical form."""
+    value = normalize(value)
+    if not value or table_name not in SYNONYM_TABLES:
+        return [value] if value else []
+    canonical = synonym_lookup(table_name).get(value)
+    if canonical is None:
+        return [value]
+    return sorted({value, canonical, *SYNONYM_TABLES[table_name][canonical]})
+
+
+def lost_item_as_claim(lost_item: dict) -> dict:
+    """Map a lost_items row onto the claim fields compute_claim_score expects."""
+    return {
+        "claimed_category": lost_item.get("category"),
+        "claimed_item_type": lost_item.get("item_type"),
+        "claimed_brand": lost_item.get("brand"),
+        "claimed_color": lost_item.get("color"),
+        "claimed_location": lost_item.get("last_seen_location"),
+        "claimed_private_details": lost_item.get("private_details"),
+    }
+
+
+def match_lost_item(lost_item: dict, top_k: int = None, candidate_limit: int = None) -> list:
+    """
+    Rank found items for a lost item report.
+
+    Candidates come from the inverted index (any shared category, item_type,
+    brand or color token) and the trigram index (similar brand, color -
+    including color synonyms - or location spellings); only those are scored
+    with SCORING_RULES.
+
+    Returns:
+        list: Up to top_k {"found_item", "score", "matched", "breakdown"}, best first.
+    """
+    top_k = top_k or Config.MATCH_TOP_K
+    candidate_limit = candidate_limit or Config.MATCH_CANDIDATE_LIMIT
+
+    terms = {field: lost_item.get(field) for field in INDEXED_FIELDS}
+    color_terms = expand_synonyms(lost_item.get("color"), "color")
+    terms["color"] = " ".join(color_terms)
+    candidates = find_found_item_candidates(terms, limit=candidate_limit)
+
+    fuzzy_terms = {
+        column: [normalize(lost_item.get(field))]
+        for field, column in FUZZY_FIELDS.items()
+    }
+    fuzzy_terms["color"] = color_terms
+    seen = {item["id"] for item in candidates}
+    for found_item in find_similar_found_items(fuzzy_terms, limit=candidate_limit):
+        if found_item["id"] not in seen:
+            seen.add(found_item["id"])
+            candidates.append(found_item)
+
+    claim_data = lost_item_as_claim(lost_item)
+
+    matches = []
+    for found_item in candidates:
+        score = compute_claim_score(claim_data, found_item)
+        if score["total"] > 0:
+            matches.append({
+                "found_item": found_item,
+                "score": score["total"],
+                "matched": score["matched"],
+                "breakdown": score["breakdown"]
+            })
+
+    matches.sort(key=lambda match: (-match["score"], -match["found_item"]["id"]))
+    return matches[:top_k]
+
+
+def get_matches_for_lost_item(lost_item_id: int, params: dict = None) -> tuple:
+    """
+    Returns the most likely found items for a lost item.
+
+    Args:
+        lost_item_id (int): lost_items.id
+        params (dict): Query args - optional top_k
+
+    Returns:
+        tuple: (list of matches, HTTP status)
+    """
+    params = params or {}
+    top_k = None
+    if params.get("top_k"):
+        top_k = validate_int(params["top_k"], "top_k")
+        if top_k < 1:
+            raise ValidationError("top_k must be a positive integer", 400)
+        top_k = min(top_k, 100)
+
+    lost_item = get_lost_item_by_id(lost_item_id)
+    if not lost_item:
+        raise ValidationError(f"Lost item ID {lost_item_id} not found", 404)
+
+    return match_lost_item(lost_item, top_k=top_k), 200
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.config.config import Config
+from backend.config.claim_scoring import SCORING_RULES, SYNONYM_TABLES
+from backend.models import (
+    transaction,
+    serialized_write,
+    get_pending_claims_for_scoring,
+    count_pending_claims,
+    update_claim_scores,
+    get_checkpoint,
+    save_checkpoint,
+    clear_checkpoint,
+)
+from backend.services.claim_scoring import compute_claim_score
+
+CHECKPOINT_NAME = "rescore_pending_claims"
+
+
+def rules_fingerprint(rules: dict = None, synonyms: dict = None) -> str:
+    """
+    Stable hash of the scoring rules and the synonym tables the fuzzy
+    tolerance reads; a checkpoint only resumes when neither changed.
+    """
+    payload = json.dumps(
+        {"rules": rules or SCORING_RULES, "synonyms": synonyms or SYNONYM_TABLES},
+        sort_keys=True
+    ).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def score_chunk(rows: list) -> list:
+    """Score one chunk of joined claim rows. Runs in worker processes."""
+    scores = []
+    for row in rows:
+        total = compute_claim_score(row, row)["total"]
+        if total != row["score"]:
+            scores.append((total, row["id"]))
+    return scores
+
+
+def _iter_chunks(after_id: int, chunk_size: int):
+    while True:
+        rows = get_pending_claims_for_scoring(after_id, chunk_size)
+        if not rows:
+            return
+        after_id = rows[-1]["id"]
+        yield rows
+
+
+@serialized_write
+def _write_chunk(scores: list[tuple], last_claim_id: int, fingerprint: str) -> int:
+    """Write one chunk of scores and its checkpoint atomically; returns rows updated."""
+    with transaction():
+        updated = update_claim_scores(scores)
+        save_checkpoint(CHECKPOINT_NAME, last_claim_id, fingerprint)
+    return updated
+
+
+def rescore_pending_claims(chunk_size: int = None, workers: int = None, resume: bool = True, progress=None) -> dict:
+    """
+    Recompute claims.score for every pending claim under the current SCORING_RULES.
+
+    Claims are read in id order in chunks, scored across a process pool and
+    written back chunk by chunk in short transactions; each transaction also
+    advances the checkpoint, so an interrupted run resumes where it stopped
+    (as long as the rules and synonym tables are unchanged).
+
+    Args:
+        chunk_size (int): Claims per read / write transaction
+        workers (int): Scoring processes; 1 scores inline
+        resume (bool): Continue from the last checkpoint for the same rules
+        progress (callable): Called with a stats dict after each chunk
+
+    Returns:
+        dict: processed, updated, last_claim_id, resumed_from, seconds
+    """
+    chunk_size = chunk_size or Config.RESCORE_CHUNK_SIZE
+    workers = workers or Config.RESCORE_WORKERS
+    fingerprint = rules_fingerprint()
+
+    checkpoint = get_checkpoint(CHECKPOINT_NAME)
+    after_id = 0
+    if resume and checkpoint and checkpoint["fingerprint"] == fingerprint:
+        after_id = checkpoint["position"]
+
+    stats = {
+        "processed": 0,
+        "updated": 0,
+        "total": count_pending_claims(after_id),
+        "last_claim_id": after_id,
+        "resumed_from": after_id,
+    }
+    started = time.monotonic()
+
+    def commit(rows, scores):
+        stats["updated"] += _write_chunk(scores, rows[-1]["id"], fingerprint)
+        stats["processed"] += len(rows)
+        stats["last_claim_id"] = rows[-1]["id"]
+        if progress:
+            progress(dict(stats, seconds=time.monotonic() - started))
+
+    if workers <= 1:
+        for rows in _iter_chunks(after_id, chunk_size):
+            commit(rows, score_chunk(rows))
+    else:
+        # Bounded pipeline: results are written in submission order so the
+        # checkpoint never skips an unwritten chunk.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque()
+            for rows in _iter_chunks(after_id, chunk_size):
+                in_flight.append((rows, pool.submit(score_chunk, rows)))
+                if len(in_flight) >= workers * 2:
+                    done_rows, future = in_flight.popleft()
+                    commit(done_rows, future.result())
+            while in_flight:
+                done_rows, future = in_flight.popleft()
+                commit(done_rows, future.result())
+
+    clear_checkpoint(CHECKPOINT_NAME)
+    stats["seconds"] = round(time.monotonic() - started, 3)
+    return stats
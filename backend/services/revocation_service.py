@@ -0,0 +1,121 @@
+import hashlib
+import math
+import threading
+import time
+from backend.config.config import Config
+from backend.models import (
+    revoke_token,
+    is_token_revoked_in_db,
+    get_revocations_since,
+    purge_expired_revocations,
+)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, value: str):
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class RevocationStore:
+    """
+    Token revocations shared by every worker through the revoked_tokens table.
+
+    Each process keeps a Bloom filter of revoked jtis in front of the table, so
+    checking a token that was never revoked (nearly every request) costs no
+    query. The filter pulls rows added by other workers at most every
+    sync_interval seconds and is rebuilt without expired jtis every
+    purge_interval seconds. A filter hit is confirmed against the table.
+
+    Token checks only read. Expired rows are deleted on the logout path (at
+    most every purge_interval seconds per process) or by
+    `python -m backend.cli purge-revocations`.
+    """
+
+    def __init__(self, sync_interval: float, purge_interval: float, capacity: int, error_rate: float):
+        self.sync_interval = sync_interval
+        self.purge_interval = purge_interval
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._last_id = 0
+        self._synced_at = 0.0
+        self._rebuilt_at = 0.0
+        self._purged_at = None
+
+    def _rebuild(self):
+        rows = get_revocations_since(0)
+        bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+        for _, jti in rows:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._last_id = rows[-1][0] if rows else 0
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._bloom is not None and now - self._synced_at < self.sync_interval:
+            return
+        with self._lock:
+            if self._bloom is not None and now - self._synced_at < self.sync_interval:
+                return
+            if self._bloom is None or now - self._rebuilt_at >= self.purge_interval:
+                self._rebuild()
+                self._rebuilt_at = now
+            else:
+                for row_id, jti in get_revocations_since(self._last_id):
+                    self._bloom.add(jti)
+                    self._last_id = row_id
+            self._synced_at = now
+
+    def revoke(self, jti: str, expires_at: int):
+        """Revoke a token until expires_at (its `exp` claim)."""
+        revoke_token(jti, expires_at)
+        if self._purged_at is None or time.monotonic() - self._purged_at >= self.purge_interval:
+            self.purge()
+        self._refresh()
+        # Visible to this worker immediately, to the others within sync_interval
+        self._bloom.add(jti)
+
+    def purge(self) -> int:
+        """Delete revocations of tokens that have expired anyway; returns rows removed."""
+        self._purged_at = time.monotonic()
+        return purge_expired_revocations()
+
+    def is_revoked(self, jti: str) -> bool:
+        self._refresh()
+        if jti not in self._bloom:
+            return False
+        return is_token_revoked_in_db(jti)
+
+    def reset(self):
+        """Drop the in-process filter so the next check reloads it from the table."""
+        with self._lock:
+            self._bloom = None
+            self._last_id = 0
+
+
+revocation_store = RevocationStore(
+    sync_interval=Config.REVOCATION_SYNC_INTERVAL,
+    purge_interval=Config.REVOCATION_PURGE_INTERVAL,
+    capacity=Config.REVOCATION_BLOOM_CAPACITY,
+    error_rate=Config.REVOCATION_BLOOM_ERROR_RATE,
+)